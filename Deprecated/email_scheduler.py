@@ -28,7 +28,7 @@ class EmailScheduler:
             response = requests.get(url, headers=headers, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
 
             stories = []
             # Adjust these selectors based on actual website structure
@@ -84,15 +84,18 @@ class EmailScheduler:
         return unsent_stories
 
     def mark_stories_as_sent(self, user_email, stories):
-        """Mark stories as sent to avoid duplicates"""
+        """Mark stories as sent to avoid duplicates and update the user's last sent time in one transaction"""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        for story in stories:
-            cursor.execute('''
-                INSERT INTO sent_stories (user_email, story_title, story_url)
-                VALUES (?, ?, ?)
-            ''', (user_email, story['title'], story['url']))
+        cursor.executemany('''
+            INSERT INTO sent_stories (user_email, story_title, story_url)
+            VALUES (?, ?, ?)
+        ''', [(user_email, story['title'], story['url']) for story in stories])
+
+        cursor.execute('''
+            UPDATE users SET last_sent = ? WHERE email = ?
+        ''', (datetime.now(), user_email))
 
         conn.commit()
         conn.close()
@@ -152,18 +155,9 @@ Delivered: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
                 f.write(f"Date: {datetime.now()}\n\n")
                 f.write(email_content)
 
-            # Mark stories as sent
+            # Mark stories as sent and update last sent time
             self.mark_stories_as_sent(email, stories_to_send)
 
-            # Update last sent time
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE users SET last_sent = ? WHERE email = ?
-            ''', (datetime.now(), email))
-            conn.commit()
-            conn.close()
-
             print(f"Email sent to {email}: {filename}")
 
         except Exception as e:
@@ -7,24 +7,365 @@ from kivy.uix.button import Button
 from kivy.uix.spinner import Spinner
 from kivy.uix.popup import Popup
 from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.properties import ObjectProperty, StringProperty
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.screenmanager import ScreenManager, Screen
 from kivy.clock import Clock
+from kivy.graphics import Color, Rectangle
 
 import sqlite3
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
+import re
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import threading
+import queue
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import os
+import functools
+from itertools import chain, islice
 import webbrowser
+from urllib.parse import urlparse
+from types import MappingProxyType
 
 kivy.require('2.0.0')
 
+# Issue Areas list (based on common solutions journalism topics)
+ISSUE_AREAS = (
+    'All Issues', 'Education', 'Health', 'Housing', 'Environment', 'Criminal Justice',
+    'Economic Development', 'Democracy & Governance', 'Immigration', 'Transportation',
+    'Food Security', 'Mental Health', 'Community Development', 'Technology',
+    'Energy', 'Agriculture', 'Social Services', 'Arts & Culture', 'Youth Development',
+    'Senior Services', 'Public Safety', 'Infrastructure', 'Workforce Development'
+)
+
+FREQUENCIES = ('Daily', 'Weekly', 'Monthly')
+
+# Concurrent story page fetches when resolving original article links
+ORIGINAL_ARTICLE_WORKERS = 6
+
+# Maximum decompressed bytes read from a story page
+MAX_PAGE_BYTES = 128 * 1024
+
+# Story pages that declare a larger body than this are skipped without reading
+MAX_PAGE_CONTENT_LENGTH = 1_500_000
+
+# Average story page fetches per second across all workers
+REQUESTS_PER_SECOND = 2.0
+
+# Seconds a scraped (issue area, limit) result is reused for repeat clicks
+STORY_CACHE_TTL = 300
+
+# Fixed parts of the simulated test email, pre-encoded for binary writes
+TEST_EMAIL_HEADER = b"""
+Hello!
+
+This is a test email from your Solutions Story Tracker subscription.
+
+Here are some recent stories:
+
+"""
+
+TEST_EMAIL_FOOTER = b"""
+Best regards,
+Solutions Story Tracker App
+
+---
+This is a simulated email. In production, this would be sent via SMTP.
+"""
+
+# Set once the sent emails folder has been created for this run
+sent_emails_dir_ready = False
+
+# Link texts that name the original story, in priority order
+ORIGINAL_TEXT_PATTERNS = ['go to original story', 'read the full story', 'view original', 'original article']
+ORIGINAL_TEXT_RE = re.compile('|'.join(map(re.escape, ORIGINAL_TEXT_PATTERNS)))
+
+# Substrings that make a link text look like a pointer to the original article
+PRIMARY_LINK_WORDS_RE = re.compile('read|original|full|source|view|go')
+SECONDARY_LINK_WORDS_RE = re.compile('more|article|story')
+
+# Links to these domains are never the original article
+EXCLUDED_LINK_DOMAINS = [
+    'solutionsjournalism.org',
+    'storytracker.solutionsjournalism.org',
+    'facebook.com', 'twitter.com', 'instagram.com', 'linkedin.com',
+    'youtube.com', 'flipboard.com'
+]
+EXCLUDED_LINK_RE = re.compile('|'.join(map(re.escape, EXCLUDED_LINK_DOMAINS)), re.IGNORECASE)
+
+ANCHOR_XPATH = etree.XPath('//a[@href]')
+
+# Story link selectors in priority order. Links containing /stories/ cover the
+# article and story-class selectors as well; the card and title classes are
+# only consulted when a page has no such links.
+STORY_LINK_XPATHS = (
+    etree.XPath("//a[contains(@href, '/stories/')]"),
+    etree.XPath("//*[contains(concat(' ', normalize-space(@class), ' '), ' story-card ')]//a"),
+    etree.XPath("//*[contains(concat(' ', normalize-space(@class), ' '), ' story-title ')]//a"),
+)
+
+# Common outlet mappings, keyed by registered domain
+OUTLET_MAPPINGS = {
+    'nytimes.com': 'The New York Times',
+    'washingtonpost.com': 'The Washington Post',
+    'npr.org': 'NPR',
+    'cnn.com': 'CNN',
+    'bbc.com': 'BBC',
+    'reuters.com': 'Reuters',
+    'ap.org': 'Associated Press',
+    'usatoday.com': 'USA Today',
+    'wsj.com': 'The Wall Street Journal',
+    'chicagotribune.com': 'Chicago Tribune',
+    'sfchronicle.com': 'San Francisco Chronicle',
+    'miamiherald.com': 'Miami Herald',
+    'tampabay.com': 'Tampa Bay Times',
+    'twincities.com': 'Twin Cities Pioneer Press',
+    'startribune.com': 'Star Tribune',
+    'dallasnews.com': 'The Dallas Morning News',
+    'houstonchronicle.com': 'Houston Chronicle',
+    'seattletimes.com': 'The Seattle Times',
+    'denverpost.com': 'The Denver Post',
+    'bostonglobe.com': 'The Boston Globe',
+    'philly.com': 'The Philadelphia Inquirer',
+    'ajc.com': 'The Atlanta Journal-Constitution',
+    'pbs.org': 'PBS NewsHour',
+    'themarshallproject.org': 'The Marshall Project',
+    'pewtrusts.org': 'The Pew Charitable Trusts',
+    'csmonitor.com': 'The Christian Science Monitor',
+    'edweek.org': 'Education Week'
+}
+
+
+# Issue-specific fallback stories
+FALLBACK_ISSUE_STORIES = {
+    'Health': [
+        {
+            'title': 'How Rural Hospitals Are Using Telemedicine to Save Lives',
+            'url': 'https://www.npr.org/sections/health-shots/2024/12/01/rural-hospitals-telemedicine-success',
+            'outlet': 'NPR'
+        },
+        {
+            'title': 'Community Health Workers Bridge Care Gaps',
+            'url': 'https://www.washingtonpost.com/health/2024/11/20/community-health-workers-success/',
+            'outlet': 'The Washington Post'
+        }
+    ],
+    'Housing': [
+        {
+            'title': 'Community Land Trusts: A National Model for Affordable Housing',
+            'url': 'https://www.washingtonpost.com/business/2024/11/15/community-land-trusts-affordable-housing/',
+            'outlet': 'The Washington Post'
+        },
+        {
+            'title': 'How Housing First Programs End Chronic Homelessness',
+            'url': 'https://www.nytimes.com/2024/10/15/us/housing-first-homelessness.html',
+            'outlet': 'The New York Times'
+        }
+    ],
+    'Criminal Justice': [
+        {
+            'title': 'Mental Health Courts: A Growing Solution to Mass Incarceration',
+            'url': 'https://www.themarshallproject.org/2024/11/08/mental-health-courts-mass-incarceration-solution',
+            'outlet': 'The Marshall Project'
+        },
+        {
+            'title': 'Community Violence Intervention Programs Show Results',
+            'url': 'https://www.pewtrusts.org/en/research-and-analysis/articles/2024/12/10/community-violence-intervention-data-driven-prevention',
+            'outlet': 'The Pew Charitable Trusts'
+        }
+    ],
+    'Environment': [
+        {
+            'title': 'Green Infrastructure: How Cities Are Fighting Climate Change',
+            'url': 'https://www.reuters.com/sustainability/climate-energy/cities-green-infrastructure-climate-change-2024-12-03/',
+            'outlet': 'Reuters'
+        },
+        {
+            'title': 'How Community Solar Is Democratizing Clean Energy',
+            'url': 'https://www.csmonitor.com/Environment/2024/1118/community-solar-democratizing-clean-energy',
+            'outlet': 'The Christian Science Monitor'
+        }
+    ],
+    'Education': [
+        {
+            'title': 'How Digital Equity Programs Bridge the Homework Gap',
+            'url': 'https://www.edweek.org/technology/how-digital-equity-programs-bridge-homework-gap/2024/10',
+            'outlet': 'Education Week'
+        },
+        {
+            'title': 'Community Schools Transform Neighborhoods',
+            'url': 'https://www.npr.org/2024/11/12/education/community-schools-transform-neighborhoods',
+            'outlet': 'NPR'
+        }
+    ]
+}
+
+# General fallback stories
+FALLBACK_GENERAL_STORIES = [
+    {
+        'title': 'How Participatory Budgeting Is Strengthening Democracy',
+        'url': 'https://www.nytimes.com/2024/10/20/us/participatory-budgeting-democracy.html',
+        'outlet': 'The New York Times'
+    },
+    {
+        'title': 'Food Recovery Programs Fight Hunger and Food Waste',
+        'url': 'https://www.usatoday.com/story/news/2024/11/25/food-recovery-programs-hunger-waste/12345678901/',
+        'outlet': 'USA Today'
+    },
+    {
+        'title': 'Refugee Integration Programs Transform Communities Nationwide',
+        'url': 'https://www.pbs.org/newshour/nation/refugee-integration-programs-transform-communities',
+        'outlet': 'PBS NewsHour'
+    }
+]
+
+
+@functools.lru_cache(maxsize=32)
+def select_fallback_stories(issue_area, limit):
+    """Pick the fallback stories for an issue area, cached as an immutable slice"""
+    # Get issue-specific stories if available, otherwise use general stories
+    if issue_area and issue_area in FALLBACK_ISSUE_STORIES:
+        available_stories = chain(FALLBACK_ISSUE_STORIES[issue_area], FALLBACK_GENERAL_STORIES)
+    else:
+        available_stories = FALLBACK_GENERAL_STORIES
+
+    return tuple(islice(available_stories, limit))
+
+
+class TokenBucket:
+    """Thread-safe token bucket: allows bursts of up to `burst` requests while averaging `rate` per second"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available and take it"""
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                time.sleep((1 - self.tokens) / self.rate)
+
+
+# Shared by every worker so the site sees one polite request rate
+REQUEST_BUCKET = TokenBucket(REQUESTS_PER_SECOND, ORIGINAL_ARTICLE_WORKERS)
+
+
+class ArticleCard(BoxLayout):
+    """Card widget for one article, recycled by the browse screen's RecycleView"""
+    title = StringProperty('')
+    outlet = StringProperty('')
+    url = StringProperty('')
+    article = ObjectProperty(None, allownone=True)
+    screen = ObjectProperty(None, allownone=True)
+
+    def __init__(self, **kwargs):
+        super(ArticleCard, self).__init__(
+            orientation='vertical',
+            spacing=8,
+            padding=15,
+            **kwargs
+        )
+
+        # Add background color
+        with self.canvas.before:
+            Color(0.95, 0.95, 0.95, 1)  # Light gray background
+            self.rect = Rectangle(size=self.size, pos=self.pos)
+
+        self.bind(pos=self.update_rect, size=self.update_rect)
+
+        # Article title
+        # Long titles are ellipsized on one line by the text engine at the label's width
+        self.title_label = Label(
+            font_size=14,
+            bold=True,
+            color=[0.1, 0.1, 0.1, 1],
+            size_hint_y=None,
+            height=50,
+            halign='center',
+            valign='middle',
+            shorten=True,
+            shorten_from='right'
+        )
+        self.title_label.bind(width=self.update_title_width)
+        self.add_widget(self.title_label)
+
+        # Outlet information
+        self.outlet_label = Label(
+            font_size=12,
+            color=[0.4, 0.4, 0.4, 1],
+            size_hint_y=None,
+            height=25,
+            halign='center',
+            valign='middle'
+        )
+        self.add_widget(self.outlet_label)
+
+        # Button row
+        button_layout = BoxLayout(
+            orientation='horizontal',
+            size_hint_y=None,
+            height=40,
+            spacing=10
+        )
+
+        # View article button
+        view_btn = Button(
+            text='Read Original',
+            background_color=[0.2, 0.6, 0.8, 1]
+        )
+        view_btn.bind(on_press=self.on_view_pressed)
+        button_layout.add_widget(view_btn)
+
+        # Select for subscription button
+        select_btn = Button(
+            text='Select for Email',
+            background_color=[0.4, 0.7, 0.4, 1]
+        )
+        select_btn.bind(on_press=self.on_select_pressed)
+        button_layout.add_widget(select_btn)
+
+        self.add_widget(button_layout)
+
+    def update_rect(self, instance, value):
+        self.rect.pos = instance.pos
+        self.rect.size = instance.size
+
+    def update_title_width(self, instance, width):
+        instance.text_size = (width, None)
+
+    def on_title(self, instance, value):
+        self.title_label.text = value
+
+    def on_outlet(self, instance, value):
+        self.outlet_label.text = f"Source: {value}"
+
+    def on_view_pressed(self, instance):
+        self.screen.view_article(self.article)
+
+    def on_select_pressed(self, instance):
+        self.screen.select_article(self.article)
+
 
 class BrowseScreen(Screen):
     def __init__(self, app_instance, **kwargs):
@@ -60,18 +401,9 @@ class BrowseScreen(Screen):
 
         search_layout.add_widget(Label(text='Issue:', size_hint_x=None, width=60))
 
-        # Issue Areas list (based on common solutions journalism topics)
-        issue_areas = [
-            'All Issues', 'Education', 'Health', 'Housing', 'Environment', 'Criminal Justice',
-            'Economic Development', 'Democracy & Governance', 'Immigration', 'Transportation',
-            'Food Security', 'Mental Health', 'Community Development', 'Technology',
-            'Energy', 'Agriculture', 'Social Services', 'Arts & Culture', 'Youth Development',
-            'Senior Services', 'Public Safety', 'Infrastructure', 'Workforce Development'
-        ]
-
         self.browse_state_spinner = Spinner(
             text='All Issues',
-            values=issue_areas,
+            values=list(ISSUE_AREAS),
             size_hint_x=0.6
         )
         search_layout.add_widget(self.browse_state_spinner)
@@ -95,17 +427,20 @@ class BrowseScreen(Screen):
         )
         main_layout.add_widget(self.browse_status_label)
 
-        # Scrollable articles list - this takes remaining space
-        scroll = ScrollView()
-        self.articles_layout = BoxLayout(
+        # Virtualized articles list - this takes remaining space and only
+        # builds cards for the rows currently on screen
+        self.articles_view = RecycleView(viewclass='ArticleCard')
+        self.articles_layout = RecycleBoxLayout(
             orientation='vertical',
             spacing=10,
-            size_hint_y=None,
-            padding=10
+            padding=10,
+            default_size=(None, 160),  # Slightly taller to accommodate outlet info
+            default_size_hint=(1, None),
+            size_hint_y=None
         )
         self.articles_layout.bind(minimum_height=self.articles_layout.setter('height'))
-        scroll.add_widget(self.articles_layout)
-        main_layout.add_widget(scroll)
+        self.articles_view.add_widget(self.articles_layout)
+        main_layout.add_widget(self.articles_view)
 
         self.add_widget(main_layout)
 
@@ -120,16 +455,16 @@ class BrowseScreen(Screen):
         self.browse_status_label.text = f"Searching for stories about {issue_area}..."
 
         # Clear previous articles
-        self.articles_layout.clear_widgets()
+        self.articles_view.data = []
 
-        # Run search in thread
-        threading.Thread(target=self._search_stories_thread, args=(issue_area,)).start()
+        # Run search on the app's background worker
+        self.app_instance.background.submit(self._search_stories_thread, issue_area)
 
     def _search_stories_thread(self, issue_area):
         """Search for stories in a separate thread"""
         try:
             # Use the existing scrape_stories method but get more articles
-            articles = self.app_instance.scrape_stories(issue_area if issue_area != 'All Issues' else None, limit=15)
+            articles = self.app_instance.get_stories(issue_area if issue_area != 'All Issues' else None, limit=15)
             self.current_articles = articles
 
             # Update UI on main thread
@@ -148,94 +483,17 @@ class BrowseScreen(Screen):
 
         self.browse_status_label.text = f"Found {len(articles)} articles about {issue_area}"
 
-        # Clear existing widgets
-        self.articles_layout.clear_widgets()
-
-        # Add article cards
-        for i, article in enumerate(articles):
-            article_card = self._create_article_card(article, i)
-            self.articles_layout.add_widget(article_card)
-
-    def _create_article_card(self, article, index):
-        """Create a card widget for each article"""
-        # Card container with fixed height
-        card = BoxLayout(
-            orientation='vertical',
-            size_hint_y=None,
-            height=160,  # Slightly taller to accommodate outlet info
-            spacing=8,
-            padding=15
-        )
-
-        # Add background color
-        card.canvas.before.clear()
-        with card.canvas.before:
-            from kivy.graphics import Color, Rectangle
-            Color(0.95, 0.95, 0.95, 1)  # Light gray background
-            card.rect = Rectangle(size=card.size, pos=card.pos)
-
-        def update_rect(instance, value):
-            card.rect.pos = instance.pos
-            card.rect.size = instance.size
-
-        card.bind(pos=update_rect, size=update_rect)
-
-        # Article title
-        title_text = article['title'][:100] + '...' if len(article['title']) > 100 else article['title']
-
-        title_label = Label(
-            text=title_text,
-            text_size=(None, None),
-            font_size=14,
-            bold=True,
-            color=[0.1, 0.1, 0.1, 1],
-            size_hint_y=None,
-            height=50,
-            halign='center',
-            valign='middle'
-        )
-        card.add_widget(title_label)
-
-        # Outlet information
-        outlet_text = f"Source: {article.get('outlet', 'News Outlet')}"
-        outlet_label = Label(
-            text=outlet_text,
-            font_size=12,
-            color=[0.4, 0.4, 0.4, 1],
-            size_hint_y=None,
-            height=25,
-            halign='center',
-            valign='middle'
-        )
-        card.add_widget(outlet_label)
-
-        # Button row
-        button_layout = BoxLayout(
-            orientation='horizontal',
-            size_hint_y=None,
-            height=40,
-            spacing=10
-        )
-
-        # View article button
-        view_btn = Button(
-            text='Read Original',
-            background_color=[0.2, 0.6, 0.8, 1]
-        )
-        view_btn.bind(on_press=lambda x: self.view_article(article))
-        button_layout.add_widget(view_btn)
-
-        # Select for subscription button
-        select_btn = Button(
-            text='Select for Email',
-            background_color=[0.4, 0.7, 0.4, 1]
-        )
-        select_btn.bind(on_press=lambda x: self.select_article(article))
-        button_layout.add_widget(select_btn)
-
-        card.add_widget(button_layout)
-
-        return card
+        # Hand the rows to the RecycleView; it creates and reuses cards as needed
+        self.articles_view.data = [
+            {
+                'title': article['title'],
+                'outlet': article.get('outlet', 'News Outlet'),
+                'url': article['url'],
+                'article': article,
+                'screen': self
+            }
+            for article in articles
+        ]
 
     def view_article(self, article):
         """Open article in browser or show article viewer"""
@@ -319,26 +577,7 @@ class BrowseScreen(Screen):
 
     def show_popup(self, title, message):
         """Show a popup with a message"""
-        content = BoxLayout(orientation='vertical', padding=10, spacing=10)
-
-        message_label = Label(
-            text=message,
-            text_size=(400, None),
-            halign='center',
-            valign='middle'
-        )
-        content.add_widget(message_label)
-
-        close_btn = Button(
-            text='OK',
-            size_hint_y=None,
-            height=50
-        )
-        content.add_widget(close_btn)
-
-        popup = Popup(title=title, content=content, size_hint=(0.8, 0.6))
-        close_btn.bind(on_press=popup.dismiss)
-        popup.open()
+        self.app_instance.show_popup(title, message)
 
 
 class SubscriptionScreen(Screen):
@@ -379,18 +618,9 @@ class SubscriptionScreen(Screen):
         state_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=50, spacing=10)
         state_layout.add_widget(Label(text='Issue:', size_hint_x=None, width=100, halign='right'))
 
-        # Issue Areas list (same as browse screen)
-        issue_areas = [
-            'All Issues', 'Education', 'Health', 'Housing', 'Environment', 'Criminal Justice',
-            'Economic Development', 'Democracy & Governance', 'Immigration', 'Transportation',
-            'Food Security', 'Mental Health', 'Community Development', 'Technology',
-            'Energy', 'Agriculture', 'Social Services', 'Arts & Culture', 'Youth Development',
-            'Senior Services', 'Public Safety', 'Infrastructure', 'Workforce Development'
-        ]
-
         self.state_spinner = Spinner(
             text='All Issues',
-            values=issue_areas,
+            values=list(ISSUE_AREAS),
             size_hint_x=0.7
         )
         state_layout.add_widget(self.state_spinner)
@@ -401,7 +631,7 @@ class SubscriptionScreen(Screen):
         freq_layout.add_widget(Label(text='Frequency:', size_hint_x=None, width=100, halign='right'))
         self.freq_spinner = Spinner(
             text='Weekly',
-            values=['Daily', 'Weekly', 'Monthly'],
+            values=list(FREQUENCIES),
             size_hint_x=0.7
         )
         freq_layout.add_widget(self.freq_spinner)
@@ -426,7 +656,6 @@ class SubscriptionScreen(Screen):
 
         # Add background for selected article
         with self.selected_article_layout.canvas.before:
-            from kivy.graphics import Color, Rectangle
             Color(0.9, 0.95, 0.9, 1)  # Light green background
             self.selected_article_rect = Rectangle(size=self.selected_article_layout.size,
                                                    pos=self.selected_article_layout.pos)
@@ -534,16 +763,48 @@ class SubscriptionScreen(Screen):
 
 
 class StoryTrackerApp(App):
+    # Request headers that work with the site
+    HEADERS = MappingProxyType({
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1'
+    })
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.selected_article = None
 
+        # Shared session so repeated requests to the site reuse pooled keep-alive connections
+        self.http = requests.Session()
+        self.http.headers.update(self.HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+
+        # Persistent worker for UI-triggered scrapes, plus recent results keyed by (issue_area, limit)
+        self.background = ThreadPoolExecutor(max_workers=2)
+        self.story_cache = {}
+        self.story_cache_lock = threading.Lock()
+
+        # Long-lived pool for original-article lookups, so each worker keeps its database connection
+        self.resolver = ThreadPoolExecutor(max_workers=ORIGINAL_ARTICLE_WORKERS)
+
     def build(self):
         self.title = "Solutions Story Tracker - Enhanced"
 
         # Initialize database
         self.init_database()
 
+        # Reusable message popup
+        self.build_message_popup()
+
         # Create screen manager
         sm = ScreenManager()
 
@@ -563,9 +824,13 @@ class StoryTrackerApp(App):
     def init_database(self):
         """Initialize SQLite database to track users and sent stories"""
         self.db_path = '../story_tracker.db'
-        conn = sqlite3.connect(self.db_path)
+        self._db_local = threading.local()
+        conn = self.get_connection()
         cursor = conn.cursor()
 
+        # WAL lets the scraper threads read while the writer thread commits
+        cursor.execute('PRAGMA journal_mode=WAL')
+
         # Create users table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS users (
@@ -590,11 +855,82 @@ class StoryTrackerApp(App):
             )
         ''')
 
+        # Cache of story tracker pages already resolved to their original article
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS article_resolution (
+                tracker_url TEXT PRIMARY KEY,
+                original_url TEXT,
+                outlet TEXT,
+                resolved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+
         conn.commit()
-        conn.close()
+
+        # All writes go through one background thread so a commit never blocks the Kivy frame loop
+        self._db_writes = queue.Queue()
+        threading.Thread(target=self._db_writer, daemon=True).start()
+
+    def get_connection(self):
+        """Get this thread's long-lived database connection, opening it on first use"""
+        conn = getattr(self._db_local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            conn.execute('PRAGMA mmap_size=67108864')
+            self._db_local.conn = conn
+        return conn
+
+    def submit_write(self, sql, params=(), on_done=None):
+        """Queue a write for the DB writer thread; on_done(error) is then called on the Kivy thread"""
+        self._db_writes.put((sql, params, on_done))
+
+    def _db_writer(self):
+        """Apply queued writes in order on a dedicated connection"""
+        conn = self.get_connection()
+        while True:
+            sql, params, on_done = self._db_writes.get()
+            error = None
+            try:
+                with conn:
+                    conn.execute(sql, params)
+            except Exception as e:
+                print(f"Database write failed: {e}")
+                error = e
+
+            if on_done:
+                Clock.schedule_once(lambda dt, on_done=on_done, error=error: on_done(error), 0)
+            self._db_writes.task_done()
+
+    def on_stop(self):
+        """Let background work and queued writes finish before the app exits"""
+        self.background.shutdown(wait=True, cancel_futures=True)
+        self.resolver.shutdown(wait=True, cancel_futures=True)
+        self._db_writes.join()
+
+    def get_stories(self, issue_area=None, limit=5):
+        """
+        Scrape stories, reusing a recent result for the same issue area and limit
+        Fallback stories are returned when scraping fails, but never cached
+        """
+        key = (issue_area, limit)
+        now = time.monotonic()
+        with self.story_cache_lock:
+            cached = self.story_cache.get(key)
+        if cached and now - cached[0] < STORY_CACHE_TTL:
+            return cached[1]
+
+        stories = self.scrape_stories(issue_area, limit)
+        if not stories:
+            return self.get_fallback_stories(issue_area, limit)
+
+        with self.story_cache_lock:
+            self.story_cache[key] = (now, stories)
+        return stories
 
     def scrape_stories(self, issue_area=None, limit=5):
-        """Scrape stories from the Solutions Story Tracker website"""
+        """Scrape stories from the Solutions Story Tracker website; empty if none could be scraped"""
         try:
             base_url = "https://storytracker.solutionsjournalism.org/"
 
@@ -606,166 +942,169 @@ class StoryTrackerApp(App):
                     'search_stories': 'Search'
                 }
                 # Use POST method as forms typically do
-                response = requests.post(base_url, data=search_params, headers=self.get_headers(), timeout=15)
+                response = self.http.post(base_url, data=search_params, timeout=15)
             else:
-                response = requests.get(base_url, headers=self.get_headers(), timeout=15)
+                response = self.http.get(base_url, timeout=15)
 
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            doc = lxml.html.fromstring(response.content)
 
             stories = []
 
-            # Look for story links using multiple selectors
-            story_selectors = [
-                'a[href*="/stories/"]',  # Links containing /stories/
-                '.story-card a',  # Story card links
-                '.story-title a',  # Story title links
-                'article a[href*="/stories/"]',  # Article links with stories
-                '[class*="story"] a[href*="/stories/"]'  # Any story-related class
-            ]
-
+            # Look for story links, using the first selector that finds results
             story_links = []
-            for selector in story_selectors:
-                found_links = soup.select(selector)
-                if found_links:
-                    story_links.extend(found_links)
-                    break  # Use the first selector that finds results
-
-            # Fallback: find any links with /stories/ in href
-            if not story_links:
-                all_links = soup.find_all('a', href=True)
-                story_links = [link for link in all_links if '/stories/' in link.get('href', '')]
+            for selector in STORY_LINK_XPATHS:
+                story_links = selector(doc)
+                if story_links:
+                    break
 
             print(f"Found {len(story_links)} story links")  # Debug
 
-            # Process each story link
-            processed_count = 0
+            # Collect eligible story links
+            base_prefix = base_url.rstrip('/')
+            candidates = []
             for link in story_links:
-                if processed_count >= limit:
-                    break
-
                 try:
                     href = link.get('href', '')
-                    title = link.get_text().strip()
 
-                    # Skip if no meaningful title or href
-                    if not title or len(title) < 10 or not href:
-                        continue
-
-                    # Make sure it's a full URL
-                    if href.startswith('/'):
-                        story_tracker_url = base_url.rstrip('/') + href
-                    elif href.startswith('http'):
+                    # Make sure it's a full URL (checked before the costlier title extraction)
+                    if href.startswith(('http://', 'https://')):
                         story_tracker_url = href
+                    elif href.startswith('/'):
+                        story_tracker_url = base_prefix + href
                     else:
                         continue
 
+                    # Skip if no meaningful title
+                    title = link.text_content().strip()
+                    if len(title) < 10:
+                        continue
+
                     # Clean up title
                     clean_title = ' '.join(title.split())
                     if len(clean_title) > 120:
                         clean_title = clean_title[:120] + '...'
 
-                    # Get the original article URL
-                    original_url, outlet = self.get_original_article_info(story_tracker_url)
+                    candidates.append((clean_title, story_tracker_url))
+
+                except Exception as e:
+                    print(f"Error processing story link: {e}")
+                    continue
+
+            # Resolve original articles concurrently over the pooled session,
+            # only as many at a time as are still needed to reach the limit
+            while candidates and len(stories) < limit:
+                batch = candidates[:limit - len(stories)]
+                candidates = candidates[len(batch):]
 
-                    # Use original URL if found, otherwise skip this story
+                results = self.resolver.map(self.get_original_article_info, [url for _, url in batch])
+
+                # Use original URL if found, otherwise skip this story
+                for (clean_title, _), (original_url, outlet) in zip(batch, results):
                     if original_url:
                         stories.append({
                             'title': clean_title,
                             'url': original_url,
                             'outlet': outlet
                         })
-                        processed_count += 1
-
-                        # Add delay between requests to be respectful
-                        time.sleep(0.5)
-
-                except Exception as e:
-                    print(f"Error processing story link: {e}")
-                    continue
 
             print(f"Successfully processed {len(stories)} stories")
-            return stories if stories else self.get_fallback_stories(issue_area, limit)
+            return stories
 
         except Exception as e:
             print(f"Error scraping stories: {e}")
-            return self.get_fallback_stories(issue_area, limit)
-
-    def get_headers(self):
-        """Get request headers that work with the site"""
-        return {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
+            return []
 
     def get_original_article_info(self, story_tracker_url):
-        """Extract the original article URL and outlet from a story tracker page"""
+        """Extract the original article URL and outlet, using the resolution cache when possible"""
+        cached = self.get_cached_resolution(story_tracker_url)
+        if cached:
+            return cached
+
+        original_link, outlet = self.resolve_original_article_info(story_tracker_url)
+        if original_link:
+            self.cache_resolution(story_tracker_url, original_link, outlet)
+        return original_link, outlet
+
+    def get_cached_resolution(self, story_tracker_url):
+        """Return the cached (original_url, outlet) for a story tracker page, or None"""
         try:
-            response = requests.get(story_tracker_url, headers=self.get_headers(), timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Look for the "Go to Original Story" link based on our test results
-            original_link = None
-
-            # Method 1: Look for specific text patterns
-            text_patterns = ['go to original story', 'read the full story', 'view original', 'original article']
-
-            for pattern in text_patterns:
-                links = soup.find_all('a', href=True)
-                for link in links:
-                    link_text = link.get_text().strip().lower()
-                    if pattern in link_text:
-                        href = link.get('href')
-                        if href and href.startswith('http') and 'storytracker.solutionsjournalism.org' not in href:
-                            original_link = href
-                            break
-                if original_link:
-                    break
-
-            # Method 2: Use our scoring system from the test
-            if not original_link:
-                potential_articles = []
-
-                excluded_domains = [
-                    'solutionsjournalism.org',
-                    'storytracker.solutionsjournalism.org',
-                    'facebook.com', 'twitter.com', 'instagram.com', 'linkedin.com',
-                    'youtube.com', 'flipboard.com'
-                ]
-
-                for link in soup.find_all('a', href=True):
-                    href = link.get('href', '')
-                    text = link.get_text().strip()
-
-                    # Skip excluded domains
-                    if any(domain in href.lower() for domain in excluded_domains):
-                        continue
-                    if not href.startswith('http'):
-                        continue
-
-                    # Score the link
-                    score = 0
-                    text_lower = text.lower()
-                    if any(word in text_lower for word in ['read', 'original', 'full', 'source', 'view', 'go']):
-                        score += 10
-                    if any(word in text_lower for word in ['more', 'article', 'story']):
-                        score += 5
-                    if len(text) > 5:
-                        score += 2
+            return self.get_connection().execute(
+                'SELECT original_url, outlet FROM article_resolution WHERE tracker_url = ?',
+                (story_tracker_url,)
+            ).fetchone()
+        except Exception as e:
+            print(f"Error reading resolution cache: {e}")
+            return None
+
+    def cache_resolution(self, story_tracker_url, original_url, outlet):
+        """Remember where a story tracker page points so later searches skip the fetch"""
+        self.submit_write(
+            'INSERT OR REPLACE INTO article_resolution (tracker_url, original_url, outlet) VALUES (?, ?, ?)',
+            (story_tracker_url, original_url, outlet)
+        )
 
-                    if score > 0:
-                        potential_articles.append((score, href, text))
+    def resolve_original_article_info(self, story_tracker_url):
+        """Extract the original article URL and outlet from a story tracker page"""
+        try:
+            # Stream the page and stop reading at the cap; the original story
+            # link sits near the top and lxml copes with the truncated markup
+            REQUEST_BUCKET.acquire()
+            with self.http.get(story_tracker_url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+
+                # Headers arrive before the body, so oversized pages cost no download
+                content_length = int(response.headers.get('Content-Length') or 0)
+                if content_length > MAX_PAGE_CONTENT_LENGTH:
+                    print(f"Skipping oversized story page ({content_length} bytes): {story_tracker_url}")
+                    return None, None
+
+                content = response.raw.read(MAX_PAGE_BYTES, decode_content=True)
+
+            doc = lxml.html.fromstring(content)
+
+            # Look for the "Go to Original Story" link based on our test results.
+            # One pass over the anchors handles both methods:
+            # Method 1 keeps the link matching the earliest text pattern,
+            # Method 2 keeps the best (score, href, text) from our scoring system
+            pattern_match = None
+            best_scored = None
+
+            for link in ANCHOR_XPATH(doc):
+                href = link.get('href', '')
+                text = link.text_content().strip()
+                text_lower = text.lower()
+
+                # Method 1: Look for specific text patterns
+                if ORIGINAL_TEXT_RE.search(text_lower):
+                    if href.startswith('http') and 'storytracker.solutionsjournalism.org' not in href:
+                        rank = next(i for i, pattern in enumerate(ORIGINAL_TEXT_PATTERNS) if pattern in text_lower)
+                        if pattern_match is None or rank < pattern_match[0]:
+                            pattern_match = (rank, href)
+
+                # Method 2: Score the link, skipping excluded domains
+                if EXCLUDED_LINK_RE.search(href):
+                    continue
+                if not href.startswith('http'):
+                    continue
 
-                # Get the highest scoring link
-                if potential_articles:
-                    potential_articles.sort(reverse=True)
-                    original_link = potential_articles[0][1]
+                score = 0
+                if PRIMARY_LINK_WORDS_RE.search(text_lower):
+                    score += 10
+                if SECONDARY_LINK_WORDS_RE.search(text_lower):
+                    score += 5
+                if len(text) > 5:
+                    score += 2
+
+                if score > 0 and (best_scored is None or (score, href, text) > best_scored):
+                    best_scored = (score, href, text)
+
+            if pattern_match:
+                original_link = pattern_match[1]
+            elif best_scored:
+                original_link = best_scored[1]
+            else:
+                original_link = None
 
             if original_link:
                 outlet = self.extract_outlet_from_url(original_link)
@@ -784,44 +1123,18 @@ class StoryTrackerApp(App):
                 return "News Outlet"
 
             # Parse domain from URL
-            from urllib.parse import urlparse
-            domain = urlparse(url).netloc.lower()
-
-            # Common outlet mappings
-            outlet_mappings = {
-                'nytimes.com': 'The New York Times',
-                'washingtonpost.com': 'The Washington Post',
-                'npr.org': 'NPR',
-                'cnn.com': 'CNN',
-                'bbc.com': 'BBC',
-                'reuters.com': 'Reuters',
-                'ap.org': 'Associated Press',
-                'usatoday.com': 'USA Today',
-                'wsj.com': 'The Wall Street Journal',
-                'chicagotribune.com': 'Chicago Tribune',
-                'sfchronicle.com': 'San Francisco Chronicle',
-                'miamiherald.com': 'Miami Herald',
-                'tampabay.com': 'Tampa Bay Times',
-                'twincities.com': 'Twin Cities Pioneer Press',
-                'startribune.com': 'Star Tribune',
-                'dallasnews.com': 'The Dallas Morning News',
-                'houstonchronicle.com': 'Houston Chronicle',
-                'seattletimes.com': 'The Seattle Times',
-                'denverpost.com': 'The Denver Post',
-                'bostonglobe.com': 'The Boston Globe',
-                'philly.com': 'The Philadelphia Inquirer',
-                'ajc.com': 'The Atlanta Journal-Constitution'
-            }
+            domain = urlparse(url).netloc.lower().removeprefix('www.')
 
-            # Check for exact matches
-            for domain_part, outlet_name in outlet_mappings.items():
-                if domain_part in domain:
+            # Check the domain and each parent domain against the known outlets
+            parts = domain.split('.')
+            for i in range(len(parts) - 1):
+                outlet_name = OUTLET_MAPPINGS.get('.'.join(parts[i:]))
+                if outlet_name:
                     return outlet_name
 
             # Extract from domain name
-            domain_parts = domain.replace('www.', '').split('.')
-            if domain_parts:
-                base_name = domain_parts[0].replace('-', ' ').replace('_', ' ').title()
+            if parts:
+                base_name = parts[0].replace('-', ' ').replace('_', ' ').title()
                 return f"{base_name} News"
 
             return "News Outlet"
@@ -831,96 +1144,7 @@ class StoryTrackerApp(App):
 
     def get_fallback_stories(self, issue_area, limit):
         """Return fallback stories if scraping fails"""
-        # Issue-specific fallback stories
-        issue_stories = {
-            'Health': [
-                {
-                    'title': 'How Rural Hospitals Are Using Telemedicine to Save Lives',
-                    'url': 'https://www.npr.org/sections/health-shots/2024/12/01/rural-hospitals-telemedicine-success',
-                    'outlet': 'NPR'
-                },
-                {
-                    'title': 'Community Health Workers Bridge Care Gaps',
-                    'url': 'https://www.washingtonpost.com/health/2024/11/20/community-health-workers-success/',
-                    'outlet': 'The Washington Post'
-                }
-            ],
-            'Housing': [
-                {
-                    'title': 'Community Land Trusts: A National Model for Affordable Housing',
-                    'url': 'https://www.washingtonpost.com/business/2024/11/15/community-land-trusts-affordable-housing/',
-                    'outlet': 'The Washington Post'
-                },
-                {
-                    'title': 'How Housing First Programs End Chronic Homelessness',
-                    'url': 'https://www.nytimes.com/2024/10/15/us/housing-first-homelessness.html',
-                    'outlet': 'The New York Times'
-                }
-            ],
-            'Criminal Justice': [
-                {
-                    'title': 'Mental Health Courts: A Growing Solution to Mass Incarceration',
-                    'url': 'https://www.themarshallproject.org/2024/11/08/mental-health-courts-mass-incarceration-solution',
-                    'outlet': 'The Marshall Project'
-                },
-                {
-                    'title': 'Community Violence Intervention Programs Show Results',
-                    'url': 'https://www.pewtrusts.org/en/research-and-analysis/articles/2024/12/10/community-violence-intervention-data-driven-prevention',
-                    'outlet': 'The Pew Charitable Trusts'
-                }
-            ],
-            'Environment': [
-                {
-                    'title': 'Green Infrastructure: How Cities Are Fighting Climate Change',
-                    'url': 'https://www.reuters.com/sustainability/climate-energy/cities-green-infrastructure-climate-change-2024-12-03/',
-                    'outlet': 'Reuters'
-                },
-                {
-                    'title': 'How Community Solar Is Democratizing Clean Energy',
-                    'url': 'https://www.csmonitor.com/Environment/2024/1118/community-solar-democratizing-clean-energy',
-                    'outlet': 'The Christian Science Monitor'
-                }
-            ],
-            'Education': [
-                {
-                    'title': 'How Digital Equity Programs Bridge the Homework Gap',
-                    'url': 'https://www.edweek.org/technology/how-digital-equity-programs-bridge-homework-gap/2024/10',
-                    'outlet': 'Education Week'
-                },
-                {
-                    'title': 'Community Schools Transform Neighborhoods',
-                    'url': 'https://www.npr.org/2024/11/12/education/community-schools-transform-neighborhoods',
-                    'outlet': 'NPR'
-                }
-            ]
-        }
-
-        # General fallback stories
-        general_stories = [
-            {
-                'title': 'How Participatory Budgeting Is Strengthening Democracy',
-                'url': 'https://www.nytimes.com/2024/10/20/us/participatory-budgeting-democracy.html',
-                'outlet': 'The New York Times'
-            },
-            {
-                'title': 'Food Recovery Programs Fight Hunger and Food Waste',
-                'url': 'https://www.usatoday.com/story/news/2024/11/25/food-recovery-programs-hunger-waste/12345678901/',
-                'outlet': 'USA Today'
-            },
-            {
-                'title': 'Refugee Integration Programs Transform Communities Nationwide',
-                'url': 'https://www.pbs.org/newshour/nation/refugee-integration-programs-transform-communities',
-                'outlet': 'PBS NewsHour'
-            }
-        ]
-
-        # Get issue-specific stories if available, otherwise use general stories
-        if issue_area and issue_area in issue_stories:
-            available_stories = issue_stories[issue_area] + general_stories
-        else:
-            available_stories = general_stories
-
-        return available_stories[:limit]
+        return list(select_fallback_stories(issue_area, limit))
 
     def start_subscription(self, instance):
         """Start the subscription process"""
@@ -933,25 +1157,20 @@ class StoryTrackerApp(App):
             self.show_popup("Error", "Please enter a valid email address")
             return
 
-        # Save to database
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                INSERT OR REPLACE INTO users (email, state, frequency, last_sent)
-                VALUES (?, ?, ?, ?)
-            ''', (email, issue_area, frequency, datetime.now()))
-
-            conn.commit()
-            conn.close()
+        # Save to database on the writer thread
+        def on_saved(error):
+            if error:
+                self.show_popup("Error", f"Failed to create subscription: {str(error)}")
+                return
 
             self.subscription_screen.status_label.text = f"Subscription started for {email}!\nFrequency: {frequency}, Issue: {issue_area}"
             self.show_popup("Success",
                             "Subscription created successfully!\nTest emails will be saved to 'sent_emails' folder.")
 
-        except Exception as e:
-            self.show_popup("Error", f"Failed to create subscription: {str(e)}")
+        self.submit_write('''
+            INSERT OR REPLACE INTO users (email, state, frequency, last_sent)
+            VALUES (?, ?, ?, ?)
+        ''', (email, issue_area, frequency, datetime.now()), on_done=on_saved)
 
     def preview_stories(self, instance):
         """Preview stories for the selected issue area"""
@@ -959,12 +1178,12 @@ class StoryTrackerApp(App):
 
         self.subscription_screen.status_label.text = "Fetching stories..."
 
-        # Run in thread to avoid blocking UI
-        threading.Thread(target=self._preview_stories_thread, args=(issue_area,)).start()
+        # Run on the background worker to avoid blocking UI
+        self.background.submit(self._preview_stories_thread, issue_area)
 
     def _preview_stories_thread(self, issue_area):
         """Preview stories in a separate thread"""
-        stories = self.scrape_stories(issue_area, limit=3)
+        stories = self.get_stories(issue_area, limit=3)
 
         # Update UI on main thread
         Clock.schedule_once(lambda dt: self._show_preview_popup(stories), 0)
@@ -978,9 +1197,10 @@ class StoryTrackerApp(App):
         content_layout = BoxLayout(orientation='vertical', spacing=15, size_hint_y=None, padding=10)
         content_layout.bind(minimum_height=content_layout.setter('height'))
 
-        content_text = "Recent Stories:\n\n"
-        for i, story in enumerate(stories, 1):
-            content_text += f"{i}. {story['title']}\n   URL: {story['url']}\n\n"
+        content_text = "Recent Stories:\n\n" + "".join(
+            f"{i}. {story['title']}\n   URL: {story['url']}\n\n"
+            for i, story in enumerate(stories, 1)
+        )
 
         content_label = Label(
             text=content_text,
@@ -1014,7 +1234,7 @@ class StoryTrackerApp(App):
             return
 
         self.subscription_screen.status_label.text = "Preparing test email..."
-        threading.Thread(target=self._test_email_thread, args=(email, issue_area)).start()
+        self.background.submit(self._test_email_thread, email, issue_area)
 
     def _test_email_thread(self, email, issue_area):
         """Send test email in a separate thread"""
@@ -1023,41 +1243,32 @@ class StoryTrackerApp(App):
             stories = [self.selected_article]
             subject_prefix = "Selected Article: "
         else:
-            stories = self.scrape_stories(issue_area, limit=3)
+            stories = self.get_stories(issue_area, limit=3)
             subject_prefix = "Test: "
 
         # Create email content
         subject = f"{subject_prefix}Solutions Stories about {issue_area if issue_area else 'All Issues'}"
 
-        email_content = f"""
-Hello!
-
-This is a test email from your Solutions Story Tracker subscription.
-
-Here are some recent stories:
-
-"""
+        parts = [TEST_EMAIL_HEADER]
 
         for i, story in enumerate(stories, 1):
-            email_content += f"{i}. {story['title']}\n   Read more: {story['url']}\n\n"
-
-        email_content += """
-Best regards,
-Solutions Story Tracker App
+            parts.append(f"{i}. {story['title']}\n   Read more: {story['url']}\n\n".encode('utf-8'))
 
----
-This is a simulated email. In production, this would be sent via SMTP.
-"""
+        parts.append(TEST_EMAIL_FOOTER)
+        email_content = b"".join(parts)
 
         # Save to file (simulating email send)
-        os.makedirs('../sent_emails', exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        global sent_emails_dir_ready
+        if not sent_emails_dir_ready:
+            os.makedirs('../sent_emails', exist_ok=True)
+            sent_emails_dir_ready = True
+
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         filename = f"sent_emails/test_email_{timestamp}.txt"
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(f"To: {email}\n")
-            f.write(f"Subject: {subject}\n")
-            f.write(f"Date: {datetime.now()}\n\n")
+        with open(filename, 'wb') as f:
+            f.write(f"To: {email}\nSubject: {subject}\nDate: {now}\n\n".encode('utf-8'))
             f.write(email_content)
 
         # Clear selected article after sending
@@ -1075,24 +1286,28 @@ This is a simulated email. In production, this would be sent via SMTP.
         self.subscription_screen.update_selected_article_display()  # Update the selected article display
         self.show_popup("Test Email Sent", f"Email saved to:\n{filename}\n\nCheck the file to see the email content!")
 
-    def show_popup(self, title, message):
-        """Show a popup with a message"""
+    def build_message_popup(self):
+        """Create the message popup once; show_popup only updates its text"""
         content = BoxLayout(orientation='vertical', padding=15, spacing=15)
 
-        message_label = Label(
-            text=message,
+        self.popup_label = Label(
             text_size=(400, None),
             halign='center',
             valign='middle'
         )
-        content.add_widget(message_label)
+        content.add_widget(self.popup_label)
 
         close_btn = Button(text='OK', size_hint_y=None, height=50)
         content.add_widget(close_btn)
 
-        popup = Popup(title=title, content=content, size_hint=(0.8, 0.6))
-        close_btn.bind(on_press=popup.dismiss)
-        popup.open()
+        self.message_popup = Popup(content=content, size_hint=(0.8, 0.6))
+        close_btn.bind(on_press=self.message_popup.dismiss)
+
+    def show_popup(self, title, message):
+        """Show a popup with a message"""
+        self.message_popup.title = title
+        self.popup_label.text = message
+        self.message_popup.open()
 
 
 if __name__ == '__main__':
@@ -5,11 +5,105 @@ This will help us understand if there's bot protection and how to work around it
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
-import time
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import re
+from operator import itemgetter
 from urllib.parse import urljoin, urlparse
 
+# orjson decodes structured data several times faster; fall back to the stdlib parser
+try:
+    import orjson as json_parser
+except ImportError:
+    import json as json_parser
+
+# Candidate article links checked for accessibility
+HEAD_PROBE_COUNT = 5
+
+# Bytes read from an endpoint response before deciding whether it is JSON
+SNIFF_BYTES = 2048
+
+# JSON-LD blocks larger than this are reported but not decoded
+MAX_JSON_LD_BYTES = 64 * 1024
+
+# Common bot detection patterns
+BOT_INDICATORS = (
+    'cloudflare', 'captcha', 'please verify', 'blocked',
+    'access denied', 'forbidden', 'rate limit',
+    'security check', 'human verification'
+)
+
+# Either word shows the page carries story content
+EXPECTED_CONTENT_RE = re.compile('story|solutions')
+
+# Meta tag names worth reporting on a story page
+META_KEYWORDS = ('author', 'publication', 'date', 'url', 'source')
+
+# Filter out obvious navigation/site links
+EXCLUDED_DOMAINS = (
+    'solutionsjournalism.org',
+    'storytracker.solutionsjournalism.org',
+    'facebook.com',
+    'twitter.com',
+    'instagram.com',
+    'linkedin.com',
+    'youtube.com',
+    'mailto:'
+)
+
+EXCLUDED_PATHS = (
+    '#',
+    'javascript:',
+    '/submit',
+    '/about',
+    '/contact',
+    '/privacy',
+    '/terms',
+    '/collections',
+    '/topics'
+)
+
+# Look for news-like domains
+NEWS_INDICATORS = (
+    '.com', '.org', '.net', '.edu', '.gov',
+    'news', 'post', 'times', 'herald', 'tribune',
+    'journal', 'gazette', 'chronicle', 'report'
+)
+
+# Link text words that suggest the original article
+READ_WORDS = frozenset(['read', 'original', 'full', 'source', 'view'])
+STORY_WORDS = frozenset(['more', 'article', 'story'])
+
+# Page-wide keyword counts, scanned over the raw HTML in one pass each
+SEARCH_RE = re.compile('search', re.IGNORECASE)
+LOCATION_RE = re.compile('state|location|filter', re.IGNORECASE)
+PUBLICATION_RE = re.compile('published|publication|author|date', re.IGNORECASE)
+
+# One case-insensitive alternation per class so each link is checked in a single scan
+EXCLUDED_RE = re.compile('|'.join(map(re.escape, EXCLUDED_DOMAINS + EXCLUDED_PATHS)), re.IGNORECASE)
+NEWS_RE = re.compile('|'.join(map(re.escape, NEWS_INDICATORS)), re.IGNORECASE)
+
+
+def link_score(text):
+    """Score how likely a link's text points at the original article"""
+    score = 0
+    text_lower = text.lower()
+    if any(word in text_lower for word in READ_WORDS):
+        score += 10
+    if any(word in text_lower for word in STORY_WORDS):
+        score += 5
+    if len(text) > 5:  # Prefer links with descriptive text
+        score += 2
+    return score
+
+
+def format_status(status):
+    """Describe a HEAD probe result for the report"""
+    if status is None:
+        return "Could not verify ⚠️"
+    return f"{status} ✅" if status == 200 else f"{status} ⚠️"
+
 
 def test_basic_access():
     """Test basic access to the main page"""
@@ -25,53 +119,55 @@ def test_basic_access():
         'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15'
     ]
 
-    for i, user_agent in enumerate(user_agents):
-        print(f"\nTrying User Agent {i + 1}: {user_agent[:50]}...")
-
-        headers = {
-            'User-Agent': user_agent,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'no-cache'
+    session = requests.Session()
+    session.headers.update({
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Cache-Control': 'no-cache'
+    })
+
+    # Try every user agent at once and report them as they come back
+    with ThreadPoolExecutor(max_workers=len(user_agents)) as executor:
+        futures = {
+            executor.submit(session.get, url, headers={'User-Agent': user_agent}, timeout=15): (i, user_agent)
+            for i, user_agent in enumerate(user_agents)
         }
 
-        try:
-            response = requests.get(url, headers=headers, timeout=15)
-            print(f"Status Code: {response.status_code}")
-            print(f"Response Length: {len(response.content)} bytes")
-
-            if response.status_code == 200:
-                # Check for common bot detection patterns
-                content = response.text.lower()
-                bot_indicators = [
-                    'cloudflare', 'captcha', 'please verify', 'blocked',
-                    'access denied', 'forbidden', 'rate limit',
-                    'security check', 'human verification'
-                ]
-
-                detected = [indicator for indicator in bot_indicators if indicator in content]
-                if detected:
-                    print(f"⚠️  Possible bot detection: {detected}")
-                else:
-                    print("✅ Clean response - no obvious bot detection")
-
-                # Check for story-related content
-                if 'story' in content or 'solutions' in content:
-                    print("✅ Contains expected content")
-                    return True, response
-                else:
-                    print("❌ Missing expected content")
-
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Request failed: {e}")
-
-        time.sleep(2)  # Be respectful
+        for future in as_completed(futures):
+            i, user_agent = futures[future]
+            print(f"\nUser Agent {i + 1}: {user_agent[:50]}...")
+
+            try:
+                response = future.result()
+                print(f"Status Code: {response.status_code}")
+                print(f"Response Length: {len(response.content)} bytes")
+
+                if response.status_code == 200:
+                    # Check for common bot detection patterns
+                    content = response.text.lower()
+                    detected = next((indicator for indicator in BOT_INDICATORS if indicator in content), None)
+                    if detected:
+                        print(f"⚠️  Possible bot detection: {detected}")
+                    else:
+                        print("✅ Clean response - no obvious bot detection")
+
+                    # Check for story-related content
+                    if EXPECTED_CONTENT_RE.search(content):
+                        print("✅ Contains expected content")
+                        for pending in futures:
+                            pending.cancel()
+                        return True, response
+                    else:
+                        print("❌ Missing expected content")
+
+            except requests.exceptions.RequestException as e:
+                print(f"❌ Request failed: {e}")
 
     return False, None
 
@@ -84,7 +180,7 @@ def test_search_functionality(response):
         print("No response to analyze")
         return
 
-    soup = BeautifulSoup(response.content, 'html.parser')
+    soup = BeautifulSoup(response.content, 'lxml')
 
     # Look for forms
     forms = soup.find_all('form')
@@ -103,13 +199,11 @@ def test_search_functionality(response):
             print(f"  Input: {name} ({input_type})")
 
     # Look for search-related elements
-    search_elements = soup.find_all(text=lambda text: text and 'search' in text.lower())
-    print(f"\nFound {len(search_elements)} elements containing 'search'")
+    body = response.text
+    print(f"\nFound {len(SEARCH_RE.findall(body))} mentions of 'search'")
 
     # Look for state/location filters
-    location_elements = soup.find_all(
-        text=lambda text: text and any(word in text.lower() for word in ['state', 'location', 'filter']))
-    print(f"Found {len(location_elements)} elements about location/filtering")
+    print(f"Found {len(LOCATION_RE.findall(body))} mentions of location/filtering")
 
 
 def test_story_content_extraction():
@@ -131,7 +225,7 @@ def test_story_content_extraction():
             print(f"Failed to fetch: {response.status_code}")
             return
 
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
 
         print("=== Page Analysis ===")
 
@@ -144,13 +238,11 @@ def test_story_content_extraction():
             if meta.get('property') or meta.get('name'):
                 prop = meta.get('property') or meta.get('name')
                 content = meta.get('content', '')[:100]
-                if any(keyword in prop.lower() for keyword in ['author', 'publication', 'date', 'url', 'source']):
+                if any(keyword in prop.lower() for keyword in META_KEYWORDS):
                     print(f"Meta: {prop} = {content}")
 
         # 3. Look for publication info in the content
-        publication_indicators = soup.find_all(text=lambda text: text and any(
-            word in text.lower() for word in ['published', 'publication', 'author', 'date']))
-        print(f"\nFound {len(publication_indicators)} publication indicators")
+        print(f"\nFound {len(PUBLICATION_RE.findall(response.text))} publication indicators")
 
         # 4. Find the main content area
         content_areas = soup.find_all(['article', 'main', '.content', '.story-content', '.story-body'])
@@ -161,8 +253,12 @@ def test_story_content_extraction():
         if json_ld:
             print(f"Found {len(json_ld)} JSON-LD structured data blocks")
             for script in json_ld[:2]:  # Check first 2
+                raw = (script.string or '').encode('utf-8')
+                if len(raw) > MAX_JSON_LD_BYTES:
+                    print(f"Skipping large JSON-LD block ({len(raw)} bytes)")
+                    continue
                 try:
-                    data = json.loads(script.string)
+                    data = json_parser.loads(raw)
                     print(f"JSON-LD type: {data.get('@type', 'unknown')}")
                     if 'url' in data:
                         print(f"JSON-LD URL: {data['url']}")
@@ -175,95 +271,77 @@ def test_story_content_extraction():
         # Get all links and classify them
         all_links = soup.find_all('a', href=True)
 
-        # Filter out obvious navigation/site links
-        excluded_domains = [
-            'solutionsjournalism.org',
-            'storytracker.solutionsjournalism.org',
-            'facebook.com',
-            'twitter.com',
-            'instagram.com',
-            'linkedin.com',
-            'youtube.com',
-            'mailto:'
-        ]
-
-        excluded_paths = [
-            '#',
-            'javascript:',
-            '/submit',
-            '/about',
-            '/contact',
-            '/privacy',
-            '/terms',
-            '/collections',
-            '/topics'
-        ]
-
-        potential_articles = []
+        # Pages often repeat a link (headline plus "Read more"), so keep one
+        # candidate per href, with its best-scoring link text
+        candidates = {}
+        rejected_hrefs = set()
 
         for link in all_links:
             href = link.get('href', '')
-            text = link.get_text().strip()
 
-            # Skip excluded domains and paths
-            if any(domain in href.lower() for domain in excluded_domains):
-                continue
-            if any(path in href.lower() for path in excluded_paths):
-                continue
-
-            # Must be external http link
+            # Must be external http link (cheapest check first; drops relative,
+            # fragment, mailto: and javascript: links before any regex scan)
             if not href.startswith('http'):
                 continue
 
-            # Look for news-like domains
-            news_indicators = [
-                '.com', '.org', '.net', '.edu', '.gov',
-                'news', 'post', 'times', 'herald', 'tribune',
-                'journal', 'gazette', 'chronicle', 'report'
-            ]
+            if href in rejected_hrefs:
+                continue
 
-            if any(indicator in href.lower() for indicator in news_indicators):
-                potential_articles.append({
-                    'text': text[:100],
+            if href not in candidates:
+                # Skip excluded domains and paths, and keep only news-like domains
+                if EXCLUDED_RE.search(href) or not NEWS_RE.search(href):
+                    rejected_hrefs.add(href)
+                    continue
+
+            text = link.get_text().strip()[:100]
+            score = link_score(text)
+            existing = candidates.get(href)
+            if existing is None or score > existing['score']:
+                candidates[href] = {
+                    'text': text,
                     'href': href,
+                    'score': score,
                     'context': str(link.parent)[:200] if link.parent else ''
-                })
+                }
+
+        potential_articles = list(candidates.values())
 
         print(f"Found {len(potential_articles)} potential article links:")
 
         # Sort by likelihood (links with "read" or "original" text are more likely)
-        def link_score(link):
-            score = 0
-            text_lower = link['text'].lower()
-            if any(word in text_lower for word in ['read', 'original', 'full', 'source', 'view']):
-                score += 10
-            if any(word in text_lower for word in ['more', 'article', 'story']):
-                score += 5
-            if len(link['text']) > 5:  # Prefer links with descriptive text
-                score += 2
-            return score
-
-        potential_articles.sort(key=link_score, reverse=True)
+        potential_articles.sort(key=itemgetter('score'), reverse=True)
 
         # Show top candidates
         for i, link in enumerate(potential_articles[:10]):
-            score = link_score(link)
-            print(f"{i + 1:2}. [Score: {score}] '{link['text']}' -> {link['href']}")
+            print(f"{i + 1:2}. [Score: {link['score']}] '{link['text']}' -> {link['href']}")
 
         # Try to find the most likely original article
         if potential_articles:
+            # Test whether the top candidates are accessible, all at once over pooled connections
+            top_candidates = potential_articles[:HEAD_PROBE_COUNT]
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HEAD_PROBE_COUNT, pool_maxsize=HEAD_PROBE_COUNT)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+
+            def probe(href):
+                try:
+                    return session.head(href, timeout=5).status_code
+                except requests.exceptions.RequestException:
+                    return None
+
+            with ThreadPoolExecutor(max_workers=len(top_candidates)) as executor:
+                statuses = list(executor.map(probe, [candidate['href'] for candidate in top_candidates]))
+
+            print("\nAccessibility of top candidates:")
+            for candidate, status in zip(top_candidates, statuses):
+                print(f"   {format_status(status)} {candidate['href']}")
+
             best_candidate = potential_articles[0]
             print(f"\n🎯 Best candidate for original article:")
             print(f"   Text: '{best_candidate['text']}'")
             print(f"   URL: {best_candidate['href']}")
-
-            # Test if this URL is accessible
-            try:
-                test_response = requests.head(best_candidate['href'], timeout=5)
-                print(
-                    f"   Status: {test_response.status_code} ✅" if test_response.status_code == 200 else f"   Status: {test_response.status_code} ⚠️")
-            except:
-                print("   Status: Could not verify ⚠️")
+            print(f"   Status: {format_status(statuses[0])}")
 
         return potential_articles[0]['href'] if potential_articles else None
 
@@ -289,7 +367,7 @@ def test_main_page_story_links():
             print(f"Main page failed: {response.status_code}")
             return
 
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
 
         # Look for story links
         story_links = []
@@ -346,22 +424,30 @@ def test_alternative_approaches():
         'Accept': 'application/json, text/xml, application/xml, text/html, */*'
     }
 
+    session = requests.Session()
+    session.headers.update(headers)
+
     for endpoint in api_endpoints:
         print(f"\nTrying: {endpoint}")
         try:
-            response = requests.get(endpoint, headers=headers, timeout=10)
-            print(f"Status: {response.status_code}")
-            if response.status_code == 200:
-                content_type = response.headers.get('content-type', '')
-                print(f"Content-Type: {content_type}")
-                print(f"Content length: {len(response.content)} bytes")
-
-                if 'json' in content_type:
-                    try:
-                        data = response.json()
-                        print(f"JSON keys: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
-                    except:
-                        print("Invalid JSON")
+            # Stream the body so non-JSON responses are judged from their first bytes only
+            with session.get(endpoint, timeout=10, stream=True) as response:
+                print(f"Status: {response.status_code}")
+                if response.status_code == 200:
+                    content_type = response.headers.get('content-type', '')
+                    print(f"Content-Type: {content_type}")
+                    print(f"Content length: {response.headers.get('content-length', 'unknown')} bytes")
+
+                    chunks = response.iter_content(SNIFF_BYTES)
+                    head = next(chunks, b'')
+                    if 'json' in content_type or head.lstrip().startswith((b'{', b'[')):
+                        try:
+                            data = json_parser.loads(head + b''.join(chunks))
+                            print(f"JSON keys: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
+                        except:
+                            print("Invalid JSON")
+                    else:
+                        print(f"Starts with: {head[:80]!r}")
         except Exception as e:
             print(f"Error: {e}")
 
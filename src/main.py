@@ -8,6 +8,8 @@ It provides both a public subscription interface and an admin dashboard.
 import streamlit as st
 import sys
 import os
+import logging
+from logging.handlers import MemoryHandler
 from pathlib import Path
 
 # Add src directory to path for imports
@@ -23,9 +25,22 @@ from src.screens.subscription import SubscriptionScreen
 from src.screens.admin import AdminDashboard
 
 
+def configure_logging():
+    """Buffer the app's log records and write them to stderr in batches; safe to call on every rerun"""
+    app_logger = logging.getLogger('src')
+    if any(isinstance(handler, MemoryHandler) for handler in app_logger.handlers):
+        return
+
+    app_logger.setLevel(logging.INFO)
+    app_logger.addHandler(MemoryHandler(capacity=128, flushLevel=logging.WARNING,
+                                        target=logging.StreamHandler(sys.stderr)))
+
+
 def main():
     """Main application entry point"""
 
+    configure_logging()
+
     # Initialize database
     db = DatabaseManager()
 
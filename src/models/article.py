@@ -18,7 +18,7 @@ class Article:
     @property
     def url_hash(self) -> str:
         """Generate URL hash for deduplication"""
-        return hashlib.md5(self.url.encode()).hexdigest()
+        return hashlib.md5(self.url.encode(), usedforsecurity=False).hexdigest()
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization"""
@@ -1,5 +1,6 @@
 import sqlite3
 import hashlib
+import threading
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 import json
@@ -10,13 +11,17 @@ class DatabaseManager:
 
     def __init__(self, db_path='story_tracker.db'):
         self.db_path = db_path
+        self._local = threading.local()
         self.init_database()
 
     def init_database(self):
         """Initialize all database tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
         cursor = conn.cursor()
 
+        # WAL is persistent for the database file, so it only needs setting once
+        cursor.execute('PRAGMA journal_mode=WAL')
+
         # Subscribers table - replaces the old single-user approach
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS subscribers (
@@ -84,6 +89,16 @@ class DatabaseManager:
             )
         ''')
 
+        # Indexes for recent-article counts and for finding articles that were never sent
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_articles_scraped_excluded
+            ON articles (scraped_at, excluded, issue_area)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_article_sends_article_id
+            ON article_sends (article_id)
+        ''')
+
         # Legacy users table - keep for migration purposes
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS users (
@@ -105,17 +120,37 @@ class DatabaseManager:
             ('min_articles_per_category', '1')
         ]
 
-        for key, value in default_settings:
-            cursor.execute('''
-                INSERT OR IGNORE INTO admin_settings (key, value) VALUES (?, ?)
-            ''', (key, value))
-
-        conn.commit()
-        conn.close()
+        with conn:
+            for key, value in default_settings:
+                cursor.execute('''
+                    INSERT OR IGNORE INTO admin_settings (key, value) VALUES (?, ?)
+                ''', (key, value))
 
     def get_connection(self):
-        """Get database connection"""
-        return sqlite3.connect(self.db_path)
+        """
+        Get this thread's database connection
+        The connection is opened lazily and kept open so its page cache stays warm
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            return conn
+
+        conn = sqlite3.connect(self.db_path)
+
+        # NORMAL sync is safe under WAL and avoids an fsync on every commit
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')
+
+        self._local.conn = conn
+        return conn
+
+    def close(self):
+        """Close this thread's database connection, if one is open"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
 
     # SUBSCRIBER MANAGEMENT
     def add_subscriber(self, email: str, issue1: str, issue2: str, issue3: str) -> bool:
@@ -133,10 +168,9 @@ class DatabaseManager:
             conn.commit()
             return True
         except Exception as e:
+            conn.rollback()
             print(f"Error adding subscriber: {e}")
             return False
-        finally:
-            conn.close()
 
     def get_subscriber_by_email(self, email: str) -> Optional[Dict]:
         """Get subscriber by email"""
@@ -149,7 +183,6 @@ class DatabaseManager:
         ''', (email,))
 
         row = cursor.fetchone()
-        conn.close()
 
         if row:
             return {
@@ -176,7 +209,6 @@ class DatabaseManager:
         ''')
 
         rows = cursor.fetchall()
-        conn.close()
 
         return [{
             'id': row[0],
@@ -201,15 +233,26 @@ class DatabaseManager:
             conn.commit()
             return cursor.rowcount > 0
         except Exception as e:
+            conn.rollback()
             print(f"Error deactivating subscriber: {e}")
             return False
-        finally:
-            conn.close()
+
+    def get_subscribers_version(self) -> tuple:
+        """
+        Get a cheap token that changes whenever the subscribers table does
+        (inserts and replaces bump rowid, updates bump updated_at)
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('SELECT COUNT(*), MAX(rowid), MAX(updated_at) FROM subscribers')
+
+        return tuple(cursor.fetchone())
 
     # ARTICLE MANAGEMENT
     def add_article(self, title: str, url: str, outlet: str, issue_area: str) -> Optional[int]:
         """Add article to database, return article ID"""
-        url_hash = hashlib.md5(url.encode()).hexdigest()
+        url_hash = hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()
 
         conn = self.get_connection()
         cursor = conn.cursor()
@@ -231,10 +274,47 @@ class DatabaseManager:
             conn.commit()
             return article_id
         except Exception as e:
+            conn.rollback()
             print(f"Error adding article: {e}")
             return None
-        finally:
-            conn.close()
+
+    def add_articles_bulk(self, rows: List[Tuple[str, str, str, str]],
+                          scraped_at: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Add many (title, url, outlet, issue_area) rows in a single transaction,
+        all stamped with the same scraped_at (defaults to now)
+        Returns dict mapping url -> article ID
+        """
+        if not rows:
+            return {}
+
+        scraped_at = scraped_at or datetime.now()
+        hashed_rows = [(hashlib.md5(url.encode(), usedforsecurity=False).hexdigest(), title, url, outlet, issue_area, scraped_at)
+                       for title, url, outlet, issue_area in rows]
+        url_by_hash = {row[0]: row[2] for row in hashed_rows}
+
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        try:
+            # The connection opens the transaction implicitly and commits or rolls back on exit
+            with conn:
+                cursor.executemany('''
+                    INSERT OR IGNORE INTO articles 
+                    (url_hash, title, url, outlet, issue_area, scraped_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', hashed_rows)
+
+                # Look up IDs for new and already-existing articles in one query
+                placeholders = ','.join('?' * len(url_by_hash))
+                cursor.execute(f'SELECT url_hash, id FROM articles WHERE url_hash IN ({placeholders})',
+                               list(url_by_hash))
+                article_ids = {url_by_hash[url_hash]: article_id for url_hash, article_id in cursor.fetchall()}
+
+            return article_ids
+        except Exception as e:
+            print(f"Error adding articles: {e}")
+            return {}
 
     def get_fresh_articles_for_subscriber(self, subscriber_id: int, issue_areas: List[str]) -> Dict[str, List[Dict]]:
         """Get fresh articles for each issue area that haven't been sent to this subscriber"""
@@ -265,7 +345,6 @@ class DatabaseManager:
                 'scraped_at': row[5]
             } for row in rows]
 
-        conn.close()
         return articles_by_category
 
     def exclude_article(self, article_id: int, excluded: bool = True) -> bool:
@@ -281,10 +360,9 @@ class DatabaseManager:
             conn.commit()
             return cursor.rowcount > 0
         except Exception as e:
+            conn.rollback()
             print(f"Error updating article exclusion: {e}")
             return False
-        finally:
-            conn.close()
 
     # CAMPAIGN MANAGEMENT
     def create_campaign(self, campaign_type: str, scheduled_for: Optional[datetime] = None, notes: str = '') -> int:
@@ -292,16 +370,13 @@ class DatabaseManager:
         conn = self.get_connection()
         cursor = conn.cursor()
 
-        cursor.execute('''
-            INSERT INTO email_campaigns (campaign_type, scheduled_for, notes)
-            VALUES (?, ?, ?)
-        ''', (campaign_type, scheduled_for, notes))
-
-        campaign_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with conn:
+            cursor.execute('''
+                INSERT INTO email_campaigns (campaign_type, scheduled_for, notes)
+                VALUES (?, ?, ?)
+            ''', (campaign_type, scheduled_for, notes))
 
-        return campaign_id
+        return cursor.lastrowid
 
     def record_article_send(self, subscriber_id: int, article_id: int, campaign_id: int):
         """Record that an article was sent to a subscriber"""
@@ -317,23 +392,20 @@ class DatabaseManager:
 
             conn.commit()
         except Exception as e:
+            conn.rollback()
             print(f"Error recording article send: {e}")
-        finally:
-            conn.close()
 
     def mark_campaign_sent(self, campaign_id: int, total_recipients: int, articles_sent: List[int]):
         """Mark campaign as sent"""
         conn = self.get_connection()
         cursor = conn.cursor()
 
-        cursor.execute('''
-            UPDATE email_campaigns 
-            SET status = 'sent', sent_at = ?, total_recipients = ?, articles_sent = ?
-            WHERE id = ?
-        ''', (datetime.now(), total_recipients, json.dumps(articles_sent), campaign_id))
-
-        conn.commit()
-        conn.close()
+        with conn:
+            cursor.execute('''
+                UPDATE email_campaigns 
+                SET status = 'sent', sent_at = ?, total_recipients = ?, articles_sent = ?
+                WHERE id = ?
+            ''', (datetime.now(), total_recipients, json.dumps(articles_sent), campaign_id))
 
     # ADMIN SETTINGS
     def get_setting(self, key: str, default: str = None) -> Optional[str]:
@@ -343,7 +415,6 @@ class DatabaseManager:
 
         cursor.execute('SELECT value FROM admin_settings WHERE key = ?', (key,))
         row = cursor.fetchone()
-        conn.close()
 
         return row[0] if row else default
 
@@ -352,13 +423,11 @@ class DatabaseManager:
         conn = self.get_connection()
         cursor = conn.cursor()
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO admin_settings (key, value, updated_at)
-            VALUES (?, ?, ?)
-        ''', (key, value, datetime.now()))
-
-        conn.commit()
-        conn.close()
+        with conn:
+            cursor.execute('''
+                INSERT OR REPLACE INTO admin_settings (key, value, updated_at)
+                VALUES (?, ?, ?)
+            ''', (key, value, datetime.now()))
 
     # STATISTICS AND REPORTING
     def get_subscriber_stats(self) -> Dict:
@@ -385,8 +454,6 @@ class DatabaseManager:
             issue = row[0]
             issue_counts[issue] = issue_counts.get(issue, 0) + 1
 
-        conn.close()
-
         return {
             'active_subscribers': active_count,
             'inactive_subscribers': inactive_count,
@@ -407,7 +474,6 @@ class DatabaseManager:
         ''', (limit,))
 
         rows = cursor.fetchall()
-        conn.close()
 
         return [{
             'id': row[0],
@@ -1,4 +1,6 @@
 import os
+import time
+import logging
 from datetime import datetime
 from typing import List, Dict, Optional
 from pathlib import Path
@@ -6,6 +8,9 @@ from pathlib import Path
 from src.models.database import DatabaseManager
 from src.models.article import Article, Subscriber, ArticleSelector
 
+# Handlers and levels are configured by the application entry point
+logger = logging.getLogger(__name__)
+
 
 class EmailService:
     """Handles email generation and delivery for the Story Tracker app"""
@@ -25,7 +30,7 @@ class EmailService:
         selected_articles = self.article_selector.select_articles_for_subscriber(subscriber)
 
         if not any(selected_articles.values()):
-            print(f"No articles found for subscriber {subscriber.email}")
+            logger.debug("No articles found for subscriber %s", subscriber.email)
             return None
 
         # Record article sends in database
@@ -62,7 +67,8 @@ class EmailService:
         failed_sends = 0
         all_articles_sent = set()
 
-        print(f"Starting campaign {campaign_id} for {len(subscribers)} subscribers...")
+        logger.info("Starting campaign %s for %d subscribers", campaign_id, len(subscribers))
+        started = time.perf_counter()
 
         for subscriber in subscribers:
             try:
@@ -79,14 +85,14 @@ class EmailService:
                     # Save email to file
                     self._save_email_to_file(subscriber.email, html_content, campaign_id)
                     successful_sends += 1
-                    print(f"✓ Generated email for {subscriber.email}")
+                    logger.debug("Generated email for %s", subscriber.email)
                 else:
                     failed_sends += 1
-                    print(f"✗ Failed to generate email for {subscriber.email}")
+                    logger.debug("Failed to generate email for %s", subscriber.email)
 
             except Exception as e:
                 failed_sends += 1
-                print(f"✗ Error generating email for {subscriber.email}: {e}")
+                logger.warning("Error generating email for %s: %s", subscriber.email, e)
 
         # Mark campaign as sent
         if successful_sends > 0:
@@ -105,9 +111,9 @@ class EmailService:
         # Save campaign summary
         self._save_campaign_summary(campaign_id, summary)
 
-        print(f"\nCampaign {campaign_id} completed:")
-        print(f"✓ Successful: {successful_sends}")
-        print(f"✗ Failed: {failed_sends}")
+        logger.info("Campaign %s: %d ok / %d failed in %.2fs",
+                    campaign_id, successful_sends, failed_sends, time.perf_counter() - started)
+        _log_handler.flush()
 
         return summary
 
@@ -309,8 +315,6 @@ class EmailService:
                 # Record send
                 self.db.record_article_send(subscriber.id, article_id, campaign_id)
 
-        conn.close()
-
         if not articles:
             return None
 
@@ -426,7 +430,7 @@ class EmailService:
         filepath = self.output_dir / filename
         filepath.write_text(html_content, encoding='utf-8')
 
-        print(f"Email saved to: {filepath}")
+        logger.debug("Email saved to: %s", filepath)
 
     def _save_campaign_summary(self, campaign_id: int, summary: Dict):
         """Save campaign summary to file"""
@@ -438,7 +442,7 @@ class EmailService:
         filepath = self.output_dir / filename
         filepath.write_text(json.dumps(summary, indent=2), encoding='utf-8')
 
-        print(f"Campaign summary saved to: {filepath}")
+        logger.info("Campaign summary saved to: %s", filepath)
 
     def preview_newsletter_for_subscriber(self, subscriber_email: str) -> Optional[str]:
         """Generate preview of newsletter for a subscriber without recording sends"""
@@ -489,8 +493,6 @@ class EmailService:
 
         total_sends = cursor.fetchone()[0]
 
-        conn.close()
-
         return {
             'campaign_stats': campaign_stats,
             'total_sends': total_sends,
@@ -1,7 +1,12 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import functools
 import time
+import aiohttp
+import lxml.html
+from lxml import etree
+from io import BytesIO
 from datetime import datetime
+from types import MappingProxyType
 from typing import List, Optional, Dict, Tuple
 from urllib.parse import urlparse, urljoin
 
@@ -9,14 +14,140 @@ from src.models.database import DatabaseManager
 from src.models.article import Article, AVAILABLE_ISSUE_AREAS
 
 
+def _has_class(name: str) -> str:
+    """XPath predicate equivalent to the CSS class selector .name"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+def _compile_selectors(predicates: List[str]) -> Tuple[etree.XPath, List[etree.XPath]]:
+    """
+    Compile element-level (self::) XPath predicates, listed in priority order,
+    into one union query over the document plus one matcher per predicate
+    """
+    union = etree.XPath('//*[' + ' or '.join(predicates) + ']')
+    return union, [etree.XPath(predicate) for predicate in predicates]
+
+
+# Story links on listing pages - adjust selectors based on actual site structure
+STORY_LINK_SELECTORS = _compile_selectors([
+    'self::a[contains(@href, "/story/")]',                # a[href*="/story/"]
+    f'self::a[ancestor::*[{_has_class("story-title")}]]',  # .story-title a
+    f'self::*[{_has_class("story-link")}]',               # .story-link
+    'self::a[ancestor::h3]',                              # h3 a
+    'self::a[ancestor::h2]'                               # h2 a
+])
+
+# Fallback elements naming the outlet on story pages
+OUTLET_SELECTORS = _compile_selectors([
+    f'self::*[{_has_class("outlet")}]',
+    f'self::*[{_has_class("source")}]',
+    f'self::*[{_has_class("publication")}]'
+])
+
+# Nearest listing item wrapping a story link, so details are read from that story only
+STORY_ITEM_XPATH = etree.XPath(
+    'ancestor::*[self::article or self::li or '
+    f'{_has_class("story")} or {_has_class("story-item")} or {_has_class("story-card")}][1]'
+)
+
+# Outlet shown alongside a story link on listing pages, relative to its story item
+LISTING_OUTLET_XPATH = etree.XPath(f'descendant::*[{_has_class("outlet")} or {_has_class("source")}]')
+
+# Prefixes stripped from scraped titles, in the order they are removed
+TITLE_PREFIXES = ('Story: ', 'Article: ', 'News: ')
+
+# Known outlets, keyed by the first label of the domain (read-only)
+OUTLET_MAPPING = MappingProxyType({
+    'nytimes': 'The New York Times',
+    'washingtonpost': 'The Washington Post',
+    'cnn': 'CNN',
+    'bbc': 'BBC',
+    'npr': 'NPR',
+    'reuters': 'Reuters',
+    'ap': 'Associated Press',
+    'usatoday': 'USA Today'
+})
+
+
+def _domain_of(url: str) -> str:
+    """Get the lowercased domain of a URL without any www. prefix"""
+    domain = urlparse(url).netloc.lower()
+
+    # Remove common prefixes
+    if domain.startswith('www.'):
+        domain = domain[4:]
+
+    return domain
+
+
+@functools.lru_cache(maxsize=1024)
+def _outlet_for_domain(domain: str) -> Optional[str]:
+    """Get outlet name for a domain; cached since the same outlets recur across stories"""
+    # Extract main domain name
+    parts = domain.split('.')
+    if len(parts) < 2:
+        return None
+
+    # Handle known outlets, keyed directly on the (already lowercased) label
+    label = parts[0]
+    known_outlet = OUTLET_MAPPING.get(label.replace('-', ''))
+    if known_outlet:
+        return known_outlet
+
+    # Capitalize and clean up
+    return label.replace('-', ' ').title()
+
+
+# Maximum number of requests in flight to the story tracker at once
+MAX_CONCURRENT_REQUESTS = 8
+
+# Average request rate to the site, allowing short bursts, to stay polite
+REQUESTS_PER_SECOND = 2.0
+REQUEST_BURST = 4
+
+# Maximum bytes read from a response body; the links we need are near the top
+MAX_RESPONSE_BYTES = 512 * 1024
+
+# Seconds an idle pooled connection is kept open for reuse
+KEEPALIVE_TIMEOUT = 30
+
+# Transient gateway errors are retried with exponential backoff
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+
+class TokenBucket:
+    """Async token bucket: allows bursts of up to `burst` requests while averaging `rate` per second"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
 class SolutionsStoryScraper:
     """Handles scraping articles from Solutions Story Tracker website"""
 
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
         self.base_url = "https://storytracker.solutionsjournalism.org/"
-        self.session = requests.Session()
-        self.session.headers.update(self.get_default_headers())
 
     def get_default_headers(self) -> Dict[str, str]:
         """Get default headers for requests"""
@@ -24,7 +155,7 @@ class SolutionsStoryScraper:
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
@@ -34,6 +165,82 @@ class SolutionsStoryScraper:
         Scrape articles for a specific issue area
         Returns list of Article objects
         """
+        return asyncio.run(self._scrape_issue_areas([issue_area], limit))[issue_area]
+
+    async def _scrape_issue_areas(self, issue_areas: List[str], limit: int) -> Dict[str, List[Article]]:
+        """
+        Scrape several issue areas concurrently over one shared HTTP session
+        Returns dict mapping issue_area -> list of articles
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        bucket = TokenBucket(REQUESTS_PER_SECOND, REQUEST_BURST)
+
+        # Size the pool to the request limit so every in-flight request can
+        # reuse a kept-alive connection instead of a fresh TCP/TLS handshake
+        connector = aiohttp.TCPConnector(
+            limit=MAX_CONCURRENT_REQUESTS,
+            limit_per_host=MAX_CONCURRENT_REQUESTS,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=300
+        )
+
+        async with aiohttp.ClientSession(headers=self.get_default_headers(), connector=connector) as session:
+            results = await asyncio.gather(*[
+                self._scrape_articles_for_issue_async(session, semaphore, bucket, issue_area, limit)
+                for issue_area in issue_areas
+            ])
+
+        return dict(zip(issue_areas, results))
+
+    async def _fetch(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                     bucket: TokenBucket, url: str, data: Optional[Dict] = None, timeout: int = 10) -> bytes:
+        """
+        Fetch a page body (POST when form data is given)
+        Requests are capped by the shared semaphore and paced by the token bucket
+        """
+        async with semaphore:
+            client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+            for attempt in range(MAX_RETRIES + 1):
+                # Rate limiting
+                await bucket.acquire()
+
+                if data is not None:
+                    request = session.post(url, data=data, timeout=client_timeout)
+                else:
+                    request = session.get(url, timeout=client_timeout)
+
+                async with request as response:
+                    retry = response.status in RETRY_STATUSES and attempt < MAX_RETRIES
+                    if not retry:
+                        response.raise_for_status()
+                        content = await self._read_capped(response, MAX_RESPONSE_BYTES)
+
+                if not retry:
+                    break
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+        return content
+
+    async def _read_capped(self, response: aiohttp.ClientResponse, max_bytes: int) -> bytes:
+        """Read at most max_bytes of the (decompressed) body, dropping the rest unread"""
+        chunks = []
+        remaining = max_bytes
+
+        while remaining > 0:
+            chunk = await response.content.read(remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+
+        return b''.join(chunks)
+
+    async def _scrape_articles_for_issue_async(self, session: aiohttp.ClientSession,
+                                               semaphore: asyncio.Semaphore,
+                                               bucket: TokenBucket,
+                                               issue_area: str, limit: int) -> List[Article]:
+        """Scrape a single issue area, fetching story pages concurrently"""
         try:
             # Build search request for specific issue area
             if issue_area and issue_area != 'All Issues':
@@ -41,89 +248,94 @@ class SolutionsStoryScraper:
                     'issue-areas[]': issue_area,
                     'search_stories': 'Search'
                 }
-                response = self.session.post(self.base_url, data=search_params, timeout=15)
+                content = await self._fetch(session, semaphore, bucket, self.base_url, data=search_params, timeout=15)
             else:
-                response = self.session.get(self.base_url, timeout=15)
+                content = await self._fetch(session, semaphore, bucket, self.base_url, timeout=15)
 
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            doc = lxml.html.fromstring(content)
 
             # Find story links
-            story_links = self._find_story_links(soup)
+            story_links = self._find_story_links(doc)
 
             print(f"Found {len(story_links)} story links for {issue_area}")
 
-            articles = []
-            processed_count = 0
+            candidates = []
+            for href, text, listed_url, listed_outlet in story_links:
+                story_tracker_url = self._build_full_url(href)
+                if not story_tracker_url:
+                    continue
 
-            for link in story_links:
-                if processed_count >= limit:
-                    break
+                title = self._clean_title(text.strip())
+                if not title or len(title) < 10:
+                    continue
 
-                try:
-                    story_tracker_url = self._build_full_url(link.get('href', ''))
-                    if not story_tracker_url:
-                        continue
+                candidates.append((title, story_tracker_url, listed_url, listed_outlet))
 
-                    title = self._clean_title(link.get_text().strip())
-                    if not title or len(title) < 10:
+            articles = []
+            scraped_at = datetime.now()
+
+            # Fetch story pages concurrently, only as many at a time as are
+            # still needed to reach the limit
+            while candidates and len(articles) < limit:
+                batch = candidates[:limit - len(articles)]
+                candidates = candidates[len(batch):]
+
+                # Get original article URL and outlet info, fetching the story
+                # page only when the listing didn't already carry the URL
+                to_fetch = [story_tracker_url for _, story_tracker_url, listed_url, _ in batch if not listed_url]
+                results = await asyncio.gather(*[
+                    self._extract_original_article_info_async(session, semaphore, bucket, story_tracker_url)
+                    for story_tracker_url in to_fetch
+                ])
+                fetched = dict(zip(to_fetch, results))
+
+                for title, story_tracker_url, listed_url, listed_outlet in batch:
+                    if listed_url:
+                        original_url = listed_url
+                        outlet = listed_outlet or self._extract_outlet_from_url(listed_url)
+                    else:
+                        original_url, outlet = fetched[story_tracker_url]
+
+                    if not original_url:
                         continue
 
-                    # Get original article URL and outlet info
-                    original_url, outlet = self._extract_original_article_info(story_tracker_url)
-
-                    if original_url:
-                        article = Article(
-                            title=title,
-                            url=original_url,
-                            outlet=outlet,
-                            issue_area=issue_area,
-                            scraped_at=datetime.now()
-                        )
-
-                        # Add to database and get ID
-                        article_id = self.db.add_article(
-                            title=article.title,
-                            url=article.url,
-                            outlet=article.outlet,
-                            issue_area=article.issue_area
-                        )
-
-                        if article_id:
-                            article.id = article_id
-                            articles.append(article)
-                            processed_count += 1
-                            print(f"Added article: {title[:50]}...")
-
-                    # Rate limiting
-                    time.sleep(0.5)
-
-                except Exception as e:
-                    print(f"Error processing story link: {e}")
-                    continue
-
-            return articles
+                    articles.append(Article(
+                        title=title,
+                        url=original_url,
+                        outlet=outlet,
+                        issue_area=issue_area,
+                        scraped_at=scraped_at
+                    ))
+
+            # Add to database in one transaction and attach IDs
+            article_ids = self.db.add_articles_bulk([
+                (article.title, article.url, article.outlet, article.issue_area)
+                for article in articles
+            ], scraped_at=scraped_at)
+
+            stored_articles = []
+            for article in articles:
+                article.id = article_ids.get(article.url)
+                if article.id:
+                    stored_articles.append(article)
+                    print(f"Added article: {article.title[:50]}...")
+
+            return stored_articles
 
         except Exception as e:
             print(f"Error scraping articles for {issue_area}: {e}")
             return []
 
-    def _find_story_links(self, soup: BeautifulSoup) -> List:
-        """Find story links in the HTML soup"""
-        # Look for story links - adjust selectors based on actual site structure
+    def _find_story_links(self, doc: lxml.html.HtmlElement) -> List[Tuple[str, str, Optional[str], Optional[str]]]:
+        """
+        Find story links in the parsed page
+        Returns list of (href, text, listed_url, listed_outlet) tuples, where the
+        last two are the original article URL and outlet if the listing shows them
+        """
         story_links = []
 
-        # Try multiple selectors to find story links
-        selectors = [
-            'a[href*="/story/"]',
-            '.story-title a',
-            '.story-link',
-            'h3 a',
-            'h2 a'
-        ]
-
-        for selector in selectors:
-            links = soup.select(selector)
+        # Use the highest-priority selector that finds any links
+        for links in self._select_by_priority(doc, STORY_LINK_SELECTORS):
             if links:
                 story_links.extend(links)
                 break
@@ -135,10 +347,37 @@ class SolutionsStoryScraper:
             href = link.get('href', '')
             if href and href not in seen_urls:
                 seen_urls.add(href)
-                unique_links.append(link)
+                unique_links.append((href, link.text_content()) + self._listed_article_info(link))
 
         return unique_links
 
+    def _listed_article_info(self, link: lxml.html.HtmlElement) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Get the original article URL and outlet shown next to a story link on
+        the listing page, if any, so the story page doesn't need fetching
+        """
+        items = STORY_ITEM_XPATH(link)
+        container = items[0] if items else link
+
+        listed_url = link.get('data-source-url') or container.get('data-source-url')
+        if listed_url and '://' not in listed_url:
+            listed_url = None
+
+        outlet_elems = LISTING_OUTLET_XPATH(container)
+        listed_outlet = outlet_elems[0].text_content().strip() if outlet_elems else None
+
+        return listed_url, listed_outlet or None
+
+    def _select_by_priority(self, doc: lxml.html.HtmlElement,
+                            selectors: Tuple[etree.XPath, List[etree.XPath]]) -> List[List]:
+        """
+        Run the union query so the tree is walked once, then split the
+        matches back out per selector, in priority order
+        """
+        union, matchers = selectors
+        matches = union(doc)
+        return [[elem for elem in matches if matcher(elem)] for matcher in matchers]
+
     def _build_full_url(self, href: str) -> Optional[str]:
         """Build full URL from relative href"""
         if not href:
@@ -157,60 +396,44 @@ class SolutionsStoryScraper:
         # Remove extra whitespace and newlines
         title = ' '.join(title.split())
 
-        # Remove common prefixes/suffixes
-        prefixes_to_remove = ['Story: ', 'Article: ', 'News: ']
-        for prefix in prefixes_to_remove:
-            if title.startswith(prefix):
-                title = title[len(prefix):]
+        # Remove common prefixes; most titles have none, so check them all at once first
+        if title.startswith(TITLE_PREFIXES):
+            for prefix in TITLE_PREFIXES:
+                title = title.removeprefix(prefix)
 
         return title.strip()
 
-    def _extract_original_article_info(self, story_tracker_url: str) -> Tuple[Optional[str], Optional[str]]:
+    async def _extract_original_article_info_async(self, session: aiohttp.ClientSession,
+                                                   semaphore: asyncio.Semaphore,
+                                                   bucket: TokenBucket,
+                                                   story_tracker_url: str) -> Tuple[Optional[str], Optional[str]]:
         """
         Extract original article URL and outlet from story tracker page
         Returns tuple of (original_url, outlet)
         """
         try:
-            response = self.session.get(story_tracker_url, timeout=10)
-            response.raise_for_status()
+            content = await self._fetch(session, semaphore, bucket, story_tracker_url, timeout=10)
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Look for original article link - adjust selectors based on actual site
             original_url = None
             outlet = None
 
-            # Try various selectors for the original article link
-            selectors = [
-                'a[href*="://"]',  # External links
-                '.original-link a',
-                '.source-link a',
-                '.article-link a'
-            ]
-
-            for selector in selectors:
-                links = soup.select(selector)
-                for link in links:
-                    href = link.get('href', '')
-                    if href and not href.startswith(self.base_url) and '://' in href:
-                        original_url = href
-                        # Try to extract outlet from URL or link text
-                        outlet = self._extract_outlet_from_url(href) or link.get_text().strip()
-                        break
-                if original_url:
+            # Every qualifying link is an external a[href*="://"], the highest
+            # priority selector, so the first one in document order wins and
+            # parsing can stop as soon as its closing tag is seen
+            for _, link in etree.iterparse(BytesIO(content), events=('end',), tag='a', html=True):
+                href = link.get('href', '')
+                if href and not href.startswith(self.base_url) and '://' in href:
+                    original_url = href
+                    # Try to extract outlet from URL or link text
+                    outlet = self._extract_outlet_from_url(href) or ''.join(link.itertext()).strip()
                     break
 
             # Fallback: look for outlet in the page content
             if not outlet:
-                outlet_selectors = [
-                    '.outlet',
-                    '.source',
-                    '.publication'
-                ]
-                for selector in outlet_selectors:
-                    outlet_elem = soup.select_one(selector)
-                    if outlet_elem:
-                        outlet = outlet_elem.get_text().strip()
+                doc = lxml.html.fromstring(content)
+                for outlet_elems in self._select_by_priority(doc, OUTLET_SELECTORS):
+                    if outlet_elems:
+                        outlet = outlet_elems[0].text_content().strip()
                         break
 
             return original_url, outlet
@@ -222,37 +445,7 @@ class SolutionsStoryScraper:
     def _extract_outlet_from_url(self, url: str) -> Optional[str]:
         """Extract outlet name from URL"""
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-
-            # Remove common prefixes
-            if domain.startswith('www.'):
-                domain = domain[4:]
-
-            # Extract main domain name
-            parts = domain.split('.')
-            if len(parts) >= 2:
-                outlet_name = parts[0]
-
-                # Capitalize and clean up
-                outlet_name = outlet_name.replace('-', ' ').title()
-
-                # Handle known outlets
-                outlet_mapping = {
-                    'nytimes': 'The New York Times',
-                    'washingtonpost': 'The Washington Post',
-                    'cnn': 'CNN',
-                    'bbc': 'BBC',
-                    'npr': 'NPR',
-                    'reuters': 'Reuters',
-                    'ap': 'Associated Press',
-                    'usatoday': 'USA Today'
-                }
-
-                return outlet_mapping.get(outlet_name.lower().replace(' ', ''), outlet_name)
-
-            return None
-
+            return _outlet_for_domain(_domain_of(url))
         except Exception:
             return None
 
@@ -261,17 +454,10 @@ class SolutionsStoryScraper:
         Scrape articles for all available issue areas
         Returns dict mapping issue_area -> list of articles
         """
-        all_articles = {}
+        print(f"\nScraping articles for {len(AVAILABLE_ISSUE_AREAS)} issue areas")
 
-        for issue_area in AVAILABLE_ISSUE_AREAS:
-            print(f"\nScraping articles for: {issue_area}")
-            articles = self.scrape_articles_for_issue(issue_area, articles_per_issue)
-            all_articles[issue_area] = articles
-
-            # Rate limiting between issue areas
-            time.sleep(1)
-
-        return all_articles
+        # All issue areas share one session and the same request limit
+        return asyncio.run(self._scrape_issue_areas(AVAILABLE_ISSUE_AREAS, articles_per_issue))
 
     def get_recent_articles_count(self, days: int = 7) -> Dict[str, int]:
         """Get count of recently scraped articles by issue area"""
@@ -291,7 +477,6 @@ class SolutionsStoryScraper:
         ''', (cutoff_date,))
 
         results = dict(cursor.fetchall())
-        conn.close()
 
         return results
 
@@ -308,15 +493,14 @@ class SolutionsStoryScraper:
         cursor = conn.cursor()
 
         # Only delete articles that haven't been sent to anyone
-        cursor.execute('''
-            DELETE FROM articles 
-            WHERE scraped_at < ? 
-            AND id NOT IN (SELECT DISTINCT article_id FROM article_sends)
-        ''', (cutoff_date,))
+        with conn:
+            cursor.execute('''
+                DELETE FROM articles 
+                WHERE scraped_at < ? 
+                AND NOT EXISTS (SELECT 1 FROM article_sends s WHERE s.article_id = articles.id)
+            ''', (cutoff_date,))
 
         deleted_count = cursor.rowcount
-        conn.commit()
-        conn.close()
 
         print(f"Cleaned up {deleted_count} old articles")
         return deleted_count
\ No newline at end of file
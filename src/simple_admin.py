@@ -7,6 +7,33 @@ from src.models.database import DatabaseManager
 from src.models.article import AVAILABLE_ISSUE_AREAS
 
 
+# Streamlit reruns the whole script on every interaction, so cache the
+# subscriber queries briefly instead of hitting the database each time.
+# The leading underscore keeps the DatabaseManager out of the cache key.
+@st.cache_data(ttl=60)
+def _cached_subscriber_stats(_db: DatabaseManager) -> Dict:
+    return _db.get_subscriber_stats()
+
+
+@st.cache_data(ttl=60)
+def _cached_active_subscribers(_db: DatabaseManager) -> List[Dict]:
+    return _db.get_all_active_subscribers()
+
+
+# Keyed on the subscribers table version, so the DataFrame is only rebuilt
+# after the table actually changes
+@st.cache_data
+def _subscribers_table(_db: DatabaseManager, version: tuple) -> pd.DataFrame:
+    subscribers = _db.get_all_active_subscribers()
+    if not subscribers:
+        return pd.DataFrame()
+
+    df = pd.DataFrame(subscribers)
+    df['created_at'] = pd.to_datetime(df['created_at'], format='%Y-%m-%d %H:%M:%S').dt.strftime('%Y-%m-%d')
+
+    return df[['email', 'issue_area_1', 'issue_area_2', 'issue_area_3', 'created_at']]
+
+
 class SimpleAdminDashboard:
     """Simplified admin dashboard for testing"""
 
@@ -50,6 +77,9 @@ class SimpleAdminDashboard:
                 ]
             )
 
+            if st.button("🔄 Refresh Data"):
+                st.cache_data.clear()
+
         # Render selected page
         if page == "📊 Dashboard":
             self._render_dashboard()
@@ -64,7 +94,7 @@ class SimpleAdminDashboard:
 
         # Get statistics
         try:
-            subscriber_stats = self.db.get_subscriber_stats()
+            subscriber_stats = _cached_subscriber_stats(self.db)
 
             # Metrics
             col1, col2, col3 = st.columns(3)
@@ -92,20 +122,14 @@ class SimpleAdminDashboard:
         st.header("👥 Subscriber Management")
 
         try:
-            # Get all subscribers
-            subscribers = self.db.get_all_active_subscribers()
+            # Get all subscribers, formatted for display
+            df = _subscribers_table(self.db, self.db.get_subscribers_version())
 
-            if subscribers:
-                st.write(f"**Total Active Subscribers:** {len(subscribers)}")
+            if not df.empty:
+                st.write(f"**Total Active Subscribers:** {len(df)}")
 
                 # Display as table
-                df = pd.DataFrame(subscribers)
-                df['created_at'] = pd.to_datetime(df['created_at']).dt.strftime('%Y-%m-%d')
-
-                st.dataframe(
-                    df[['email', 'issue_area_1', 'issue_area_2', 'issue_area_3', 'created_at']],
-                    use_container_width=True
-                )
+                st.dataframe(df, use_container_width=True)
 
                 # Add subscriber form
                 st.subheader("➕ Add New Subscriber")
@@ -125,6 +149,7 @@ class SimpleAdminDashboard:
                             if len(set([area1, area2, area3])) == 3:
                                 success = self.db.add_subscriber(email, area1, area2, area3)
                                 if success:
+                                    st.cache_data.clear()
                                     st.success(f"✅ Added subscriber: {email}")
                                     st.rerun()
                                 else:
@@ -147,7 +172,7 @@ class SimpleAdminDashboard:
 
         # Get subscribers for testing
         try:
-            subscribers = self.db.get_all_active_subscribers()
+            subscribers = _cached_active_subscribers(self.db)
 
             if subscribers:
                 # Email preview
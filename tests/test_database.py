@@ -0,0 +1,77 @@
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from src.models.database import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    return DatabaseManager(str(tmp_path / 'story_tracker.db'))
+
+
+def test_add_articles_bulk_maps_each_url_to_its_row_id(db):
+    rows = [
+        ('First story title', 'https://example.com/a', 'Example', 'Education'),
+        ('Second story title', 'https://example.com/b', 'Example', 'Health'),
+    ]
+
+    article_ids = db.add_articles_bulk(rows)
+
+    cursor = db.get_connection().execute('SELECT url, id FROM articles')
+    assert article_ids == dict(cursor.fetchall())
+    assert set(article_ids) == {'https://example.com/a', 'https://example.com/b'}
+
+
+def test_add_articles_bulk_returns_existing_ids_for_duplicates(db):
+    first = db.add_articles_bulk([('Story title', 'https://example.com/a', 'Example', 'Education')])
+    second = db.add_articles_bulk([
+        ('Story title again', 'https://example.com/a', 'Example', 'Education'),
+        ('Another story', 'https://example.com/b', 'Example', 'Education'),
+    ])
+
+    assert second['https://example.com/a'] == first['https://example.com/a']
+    assert db.get_connection().execute('SELECT COUNT(*) FROM articles').fetchone()[0] == 2
+
+
+def test_add_articles_bulk_stamps_rows_with_scraped_at(db):
+    scraped_at = datetime(2024, 5, 1, 10, 30)
+    db.add_articles_bulk([('Story title', 'https://example.com/a', 'Example', 'Education')],
+                         scraped_at=scraped_at)
+
+    stored = db.get_connection().execute('SELECT scraped_at FROM articles').fetchone()[0]
+    assert stored == str(scraped_at)
+
+
+def test_add_articles_bulk_with_no_rows(db):
+    assert db.add_articles_bulk([]) == {}
+
+
+def test_add_articles_bulk_inside_open_transaction(db):
+    conn = db.get_connection()
+    conn.execute("INSERT INTO articles (url_hash, title, url, issue_area) "
+                 "VALUES ('pending', 'Pending story', 'https://example.com/p', 'Education')")
+    assert conn.in_transaction
+
+    article_ids = db.add_articles_bulk([('Story title', 'https://example.com/a', 'Example', 'Education')])
+
+    assert 'https://example.com/a' in article_ids
+    assert not conn.in_transaction
+
+
+def test_failed_write_leaves_connection_usable(tmp_path):
+    db = DatabaseManager(str(tmp_path / 'story_tracker.db'))
+
+    # campaign_type is NOT NULL, so the insert fails after the implicit BEGIN
+    with pytest.raises(sqlite3.IntegrityError):
+        db.create_campaign(None)
+
+    assert not db.get_connection().in_transaction
+
+    # A writer on another connection must not find the database locked
+    other = DatabaseManager(str(tmp_path / 'story_tracker.db'))
+    other.get_connection().execute('PRAGMA busy_timeout = 100')
+    other.set_setting('email_schedule_hour', '7')
+
+    assert db.get_setting('email_schedule_hour') == '7'
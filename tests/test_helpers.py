@@ -0,0 +1,200 @@
+import hashlib
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+
+import pytest
+
+from utils import helpers
+from utils.helpers import (
+    batch_process,
+    create_error_message,
+    extract_domain,
+    generate_url_hash,
+    get_next_weekday,
+    safe_filename,
+    show_error_message,
+    time_ago,
+    validate_email,
+)
+
+
+def freeze_now(monkeypatch, now):
+    """Make datetime.now() inside utils.helpers return a fixed time"""
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    monkeypatch.setattr(helpers, 'datetime', FrozenDatetime)
+
+
+def test_generate_url_hash_matches_stored_md5_keys():
+    url = 'https://www.example.com/story?id=1'
+
+    assert generate_url_hash(url) == hashlib.md5(url.encode()).hexdigest()
+
+
+@pytest.mark.parametrize('email', [
+    'reader@example.com',
+    'first.last+news@mail.example.org',
+    'a_b-c%d@sub-domain.example.co',
+])
+def test_validate_email_accepts(email):
+    assert validate_email(email)
+
+
+@pytest.mark.parametrize('email', [
+    '',
+    'reader',
+    '@example.com',
+    'reader@',
+    'reader@example',
+    'reader@example.c',
+    'reader@example.c0m',
+    'read er@example.com',
+    'reader@exa_mple.com',
+    'reader@example.com\n',
+])
+def test_validate_email_rejects(email):
+    assert not validate_email(email)
+
+
+@pytest.mark.parametrize('seconds, expected', [
+    (30, 'Just now'),
+    (60, '1 minute ago'),
+    (150, '2 minutes ago'),
+    (3600, '1 hour ago'),
+    (5 * 3600 + 59, '5 hours ago'),
+    (86400, '1 day ago'),
+    (3 * 86400 + 3600, '3 days ago'),
+    (-7200, 'Just now'),
+])
+def test_time_ago(seconds, expected):
+    assert time_ago(datetime.now() - timedelta(seconds=seconds)) == expected
+
+
+def test_time_ago_parses_iso_strings():
+    assert time_ago((datetime.now() - timedelta(days=2)).isoformat()) == '2 days ago'
+    assert time_ago('not a date') == 'not a date'
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('https://www.NYTimes.com/a/b?x=1#f', 'nytimes.com'),
+    ('http://example.com', 'example.com'),
+    ('http://example.com?q=a/b', 'example.com'),
+    ('http://example.com#x/y', 'example.com'),
+    ('//cdn.example.com/x', 'cdn.example.com'),
+    ('https://user@Host:8080/p', 'user@host:8080'),
+    ('svn+ssh://host/p', 'host'),
+    ('example.com/a', ''),
+    ('/r?u=http://x.com/', ''),
+    ('a b://x.com', ''),
+    ('mailto:reader@example.com', ''),
+    ('', ''),
+])
+def test_extract_domain_matches_urlparse(url, expected):
+    netloc = urlparse(url).netloc.lower().removeprefix('www.')
+
+    assert extract_domain(url) == expected == netloc
+
+
+@pytest.mark.parametrize('now, weekday, expected', [
+    # Thursday 2024-05-02 at 08:00
+    (datetime(2024, 5, 2, 8, 0), 3, datetime(2024, 5, 2, 9, 0)),   # same day, time still ahead
+    (datetime(2024, 5, 2, 9, 0), 3, datetime(2024, 5, 9, 9, 0)),   # same day, time reached
+    (datetime(2024, 5, 2, 8, 0), 4, datetime(2024, 5, 3, 9, 0)),   # later this week
+    (datetime(2024, 5, 2, 8, 0), 0, datetime(2024, 5, 6, 9, 0)),   # early next week
+])
+def test_get_next_weekday(monkeypatch, now, weekday, expected):
+    freeze_now(monkeypatch, now)
+
+    assert get_next_weekday(weekday, hour=9, minute=0) == expected
+
+
+def test_batch_process_yields_tuples():
+    assert list(batch_process(list(range(7)), batch_size=3)) == [(0, 1, 2), (3, 4, 5), (6,)]
+
+
+def test_batch_process_accepts_any_iterable():
+    assert list(batch_process((c for c in 'abcd'), batch_size=2)) == [('a', 'b'), ('c', 'd')]
+    assert list(batch_process([], batch_size=3)) == []
+
+
+@pytest.mark.parametrize('filename, expected', [
+    ('report.csv', 'report.csv'),
+    ('My: report?  final__v2.csv', 'My_report_final_v2.csv'),
+    ('a<>b|c*d', 'a_b_c_d'),
+    ('  _leading and trailing_. ', 'leading_and_trailing'),
+    ('tabs\tand\nnewlines', 'tabs_and_newlines'),
+])
+def test_safe_filename(filename, expected):
+    assert safe_filename(filename) == expected
+
+
+class FieldError(Exception):
+    """Exception that formats its own message without passing args"""
+
+    def __init__(self, field):
+        super().__init__()
+        self.field = field
+
+    def __str__(self):
+        return f"invalid {self.field}"
+
+
+@pytest.mark.parametrize('error, context, expected', [
+    (ValueError('bad value'), 'saving', 'An error occurred while saving: bad value'),
+    (FieldError('email'), '', 'An error occurred: invalid email'),
+    (Exception(), 'loading', 'An error occurred while loading'),
+    (None, '', 'An error occurred'),
+])
+def test_create_error_message(error, context, expected):
+    assert create_error_message(error, context) == expected
+
+
+class FakeStreamlit:
+    """Records the Streamlit calls show_error_message makes"""
+
+    def __init__(self, checked=False):
+        self.checked = checked
+        self.calls = []
+
+    def error(self, body):
+        self.calls.append(('error', body))
+
+    def checkbox(self, label, key=None):
+        self.calls.append(('checkbox', key))
+        return self.checked
+
+    def code(self, body):
+        self.calls.append(('code', body))
+
+
+def test_show_error_message_requires_key_for_details_toggle(monkeypatch):
+    fake_st = FakeStreamlit()
+    monkeypatch.setattr(helpers, 'st', fake_st)
+
+    with pytest.raises(ValueError):
+        show_error_message("Could not load articles", ValueError('boom'), show_details_toggle=True)
+    assert fake_st.calls == []
+
+
+def test_show_error_message_uses_caller_key(monkeypatch):
+    fake_st = FakeStreamlit(checked=True)
+    monkeypatch.setattr(helpers, 'st', fake_st)
+
+    show_error_message("Could not load articles", ValueError('boom'),
+                       show_details_toggle=True, key='articles_error')
+
+    assert fake_st.calls == [('error', '❌ Could not load articles'),
+                             ('checkbox', 'articles_error'),
+                             ('code', 'boom')]
+
+
+def test_show_error_message_without_toggle_renders_no_checkbox(monkeypatch):
+    fake_st = FakeStreamlit()
+    monkeypatch.setattr(helpers, 'st', fake_st)
+
+    show_error_message("Could not load articles", ValueError('boom'))
+
+    assert fake_st.calls == [('error', '❌ Could not load articles')]
@@ -0,0 +1,139 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import aiohttp
+import lxml.html
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.models.database import DatabaseManager
+from src.services import scraper as scraper_module
+from src.services.scraper import SolutionsStoryScraper, TokenBucket
+
+
+@pytest.fixture
+def db(tmp_path):
+    return DatabaseManager(str(tmp_path / 'story_tracker.db'))
+
+
+@pytest.fixture
+def scraper(db):
+    return SolutionsStoryScraper(db)
+
+
+def fetch(scraper, handler, data=None):
+    """Serve handler on a local test server and _fetch its root page"""
+    async def run():
+        app = web.Application()
+        app.router.add_route('*', '/', handler)
+        async with TestServer(app) as server:
+            async with aiohttp.ClientSession() as session:
+                return await scraper._fetch(session, asyncio.Semaphore(1), TokenBucket(1000, 10),
+                                            str(server.make_url('/')), data=data)
+
+    return asyncio.run(run())
+
+
+def test_fetch_returns_page_body(scraper):
+    async def handler(request):
+        return web.Response(body=b'<html>story</html>')
+
+    assert fetch(scraper, handler) == b'<html>story</html>'
+
+
+def test_fetch_posts_form_data(scraper):
+    received = {}
+
+    async def handler(request):
+        received['method'] = request.method
+        received['form'] = dict(await request.post())
+        return web.Response(body=b'<html>results</html>')
+
+    assert fetch(scraper, handler, data={'issue-areas[]': 'Education'}) == b'<html>results</html>'
+    assert received == {'method': 'POST', 'form': {'issue-areas[]': 'Education'}}
+
+
+def test_fetch_retries_transient_errors(scraper, monkeypatch):
+    monkeypatch.setattr(scraper_module, 'RETRY_BACKOFF', 0)
+    calls = []
+
+    async def handler(request):
+        calls.append(request.method)
+        if len(calls) < 3:
+            return web.Response(status=503)
+        return web.Response(body=b'<html>ok</html>')
+
+    assert fetch(scraper, handler) == b'<html>ok</html>'
+    assert len(calls) == 3
+
+
+def test_fetch_gives_up_after_max_retries(scraper, monkeypatch):
+    monkeypatch.setattr(scraper_module, 'RETRY_BACKOFF', 0)
+    calls = []
+
+    async def handler(request):
+        calls.append(request.method)
+        return web.Response(status=503)
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        fetch(scraper, handler)
+    assert len(calls) == scraper_module.MAX_RETRIES + 1
+
+
+def test_fetch_does_not_retry_client_errors(scraper):
+    calls = []
+
+    async def handler(request):
+        calls.append(request.method)
+        return web.Response(status=404)
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        fetch(scraper, handler)
+    assert len(calls) == 1
+
+
+def test_fetch_caps_body_size(scraper, monkeypatch):
+    monkeypatch.setattr(scraper_module, 'MAX_RESPONSE_BYTES', 1024)
+
+    async def handler(request):
+        return web.Response(body=b'x' * 10_000)
+
+    assert fetch(scraper, handler) == b'x' * 1024
+
+
+def test_get_recent_articles_count(scraper, db):
+    now = datetime.now()
+    db.add_articles_bulk([('Recent education story', 'https://example.com/a', 'Example', 'Education'),
+                          ('Recent health story', 'https://example.com/b', 'Example', 'Health')],
+                         scraped_at=now - timedelta(days=1))
+    db.add_articles_bulk([('Old education story', 'https://example.com/c', 'Example', 'Education')],
+                         scraped_at=now - timedelta(days=20))
+    excluded = db.add_articles_bulk([('Excluded health story', 'https://example.com/d', 'Example', 'Health')],
+                                    scraped_at=now - timedelta(days=1))
+    with db.get_connection() as conn:
+        conn.execute('UPDATE articles SET excluded = 1 WHERE id = ?', (excluded['https://example.com/d'],))
+
+    assert scraper.get_recent_articles_count(7) == {'Education': 1, 'Health': 1}
+    assert scraper.get_recent_articles_count(30) == {'Education': 2, 'Health': 1}
+
+
+def test_listed_article_info_reads_each_story_item(scraper):
+    doc = lxml.html.fromstring('''
+        <div class="stories">
+          <ul>
+            <li data-source-url="https://www.nytimes.com/a">
+              <h3 class="story-title"><a href="/story/1">First story</a></h3>
+              <span class="outlet">The New York Times</span>
+            </li>
+            <li>
+              <h3 class="story-title"><a href="/story/2">Second story</a></h3>
+              <span class="outlet">The Washington Post</span>
+            </li>
+          </ul>
+        </div>
+    ''')
+    first, second = doc.iter('a')
+
+    assert scraper._listed_article_info(first) == ('https://www.nytimes.com/a', 'The New York Times')
+    assert scraper._listed_article_info(second) == (None, 'The Washington Post')
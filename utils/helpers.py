@@ -2,13 +2,89 @@
 Utility functions and helpers for the Story Tracker app
 """
 
+import io
 import re
+import csv
+import sys
+import time
+import string
 import hashlib
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Union
-from urllib.parse import urlparse
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, List, Dict, Optional, Union
 import streamlit as st
 
+# ciso8601 parses ISO 8601 strings several times faster; fall back to the stdlib parser
+try:
+    from ciso8601 import parse_datetime as iso_parser
+    ISO_PARSER_ACCEPTS_Z = True
+except ImportError:
+    iso_parser = datetime.fromisoformat
+    # datetime.fromisoformat accepts a trailing 'Z' from Python 3.11 on
+    ISO_PARSER_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Characters allowed in a URL scheme after its leading letter (RFC 3986)
+URL_SCHEME_CHARS = frozenset(string.ascii_letters + string.digits + '+-.')
+
+# Leading control characters and spaces, and embedded tabs/newlines, are ignored in URLs
+URL_LEADING_JUNK = ''.join(map(chr, range(0x21)))
+URL_DROPPED_CHARS = str.maketrans('', '', '\t\r\n')
+
+# Characters allowed on each side of the @ in an email address
+EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + '.-')
+
+# Common prefixes that might appear in titles, removed in this order
+TITLE_PREFIXES = ('Story: ', 'Article: ', 'News: ', 'STORY: ')
+
+
+# Runs of invalid filename characters, whitespace and underscores, collapsed in one pass
+UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*_\s]+')
+
+# Known outlets, keyed by the first label of their domain
+OUTLET_MAPPING = {
+    'nytimes': 'The New York Times',
+    'washingtonpost': 'The Washington Post',
+    'cnn': 'CNN',
+    'bbc': 'BBC',
+    'npr': 'NPR',
+    'reuters': 'Reuters',
+    'ap': 'Associated Press',
+    'usatoday': 'USA Today',
+    'theguardian': 'The Guardian',
+    'wsj': 'The Wall Street Journal',
+    'latimes': 'Los Angeles Times',
+    'chicagotribune': 'Chicago Tribune',
+    'seattletimes': 'The Seattle Times'
+}
+
+# Weekday names indexed like datetime.weekday() (0=Monday)
+WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# Integer settings as (key, minimum, maximum or None, out-of-range message, not-a-number message)
+SETTING_RULES = (
+    ('email_schedule_day', 0, 6,
+     "Email schedule day must be 0-6 (Monday-Sunday)", "Email schedule day must be a number"),
+    ('email_schedule_hour', 0, 23,
+     "Email schedule hour must be 0-23", "Email schedule hour must be a number"),
+    ('email_schedule_minute', 0, 59,
+     "Email schedule minute must be 0-59", "Email schedule minute must be a number"),
+    ('article_retention_days', 1, None,
+     "Article retention days must be at least 1", "Article retention days must be a number"),
+)
+
+# (seconds per unit, singular, plural) for time_ago, largest unit first
+TIME_AGO_UNITS = (
+    (86400, 'day', 'days'),
+    (3600, 'hour', 'hours'),
+    (60, 'minute', 'minutes'),
+)
+
+# Default truncation suffix and its precomputed length
+DEFAULT_TRUNCATE_SUFFIX = "..."
+DEFAULT_TRUNCATE_SUFFIX_LEN = len(DEFAULT_TRUNCATE_SUFFIX)
+
 
 def validate_email(email: str) -> bool:
     """
@@ -23,8 +99,16 @@ def validate_email(email: str) -> bool:
     if not email:
         return False
 
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    local, _, domain = email.rpartition('@')
+    if not local or not domain:
+        return False
+
+    if not EMAIL_LOCAL_CHARS.issuperset(local) or not EMAIL_DOMAIN_CHARS.issuperset(domain):
+        return False
+
+    # Domain needs a name and a top-level domain of at least two letters
+    name, _, tld = domain.rpartition('.')
+    return bool(name) and len(tld) >= 2 and tld.isalpha()
 
 
 def clean_text(text: str) -> str:
@@ -44,14 +128,13 @@ def clean_text(text: str) -> str:
     text = ' '.join(text.split())
 
     # Remove common prefixes/suffixes that might appear in titles
-    prefixes_to_remove = ['Story: ', 'Article: ', 'News: ', 'STORY: ']
-    for prefix in prefixes_to_remove:
-        if text.startswith(prefix):
-            text = text[len(prefix):]
+    for prefix in TITLE_PREFIXES:
+        text = text.removeprefix(prefix)
 
     return text.strip()
 
 
+@lru_cache(maxsize=4096)
 def generate_url_hash(url: str) -> str:
     """
     Generate MD5 hash of URL for deduplication
@@ -62,9 +145,11 @@ def generate_url_hash(url: str) -> str:
     Returns:
         MD5 hash string
     """
-    return hashlib.md5(url.encode()).hexdigest()
+    # The hash is a dedup key, not a security control
+    return hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()
 
 
+@lru_cache(maxsize=4096)
 def extract_domain(url: str) -> Optional[str]:
     """
     Extract domain from URL
@@ -76,18 +161,35 @@ def extract_domain(url: str) -> Optional[str]:
         Domain name or None if invalid URL
     """
     try:
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
+        url = url.lstrip(URL_LEADING_JUNK).translate(URL_DROPPED_CHARS)
+
+        # The host follows '//', either at the start or right after a valid scheme
+        scheme_end = url.find(':')
+        if (scheme_end > 0 and url[0] in string.ascii_letters
+                and URL_SCHEME_CHARS.issuperset(url[:scheme_end])
+                and url.startswith('//', scheme_end + 1)):
+            start = scheme_end + 3
+        elif url.startswith('//'):
+            start = 2
+        else:
+            return ''
 
-        # Remove www prefix
-        if domain.startswith('www.'):
-            domain = domain[4:]
+        # It runs up to the next '/', '?' or '#'
+        end = len(url)
+        for delimiter in '/?#':
+            index = url.find(delimiter, start, end)
+            if index >= 0:
+                end = index
 
-        return domain
+        domain = url[start:end].lower()
+
+        # Remove www prefix
+        return domain.removeprefix('www.')
     except Exception:
         return None
 
 
+@lru_cache(maxsize=4096)
 def format_outlet_name(domain: str) -> str:
     """
     Format outlet name from domain
@@ -102,31 +204,22 @@ def format_outlet_name(domain: str) -> str:
         return "Unknown"
 
     # Remove domain extensions
-    domain = domain.split('.')[0]
-
-    # Handle known outlets
-    outlet_mapping = {
-        'nytimes': 'The New York Times',
-        'washingtonpost': 'The Washington Post',
-        'cnn': 'CNN',
-        'bbc': 'BBC',
-        'npr': 'NPR',
-        'reuters': 'Reuters',
-        'ap': 'Associated Press',
-        'usatoday': 'USA Today',
-        'theguardian': 'The Guardian',
-        'wsj': 'The Wall Street Journal',
-        'latimes': 'Los Angeles Times',
-        'chicagotribune': 'Chicago Tribune',
-        'seattletimes': 'The Seattle Times'
-    }
+    name = domain.partition('.')[0].lower()
 
     # Check if it's a known outlet
-    if domain.lower() in outlet_mapping:
-        return outlet_mapping[domain.lower()]
+    outlet = OUTLET_MAPPING.get(name)
+    if outlet is not None:
+        return outlet
 
     # Otherwise, capitalize and clean up
-    return domain.replace('-', ' ').replace('_', ' ').title()
+    return name.replace('-', ' ').replace('_', ' ').title()
+
+
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 string, only rewriting a trailing 'Z' where the stdlib needs it"""
+    if not ISO_PARSER_ACCEPTS_Z and value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return iso_parser(value)
 
 
 def format_datetime(dt: Union[datetime, str], format_str: str = "%Y-%m-%d %H:%M") -> str:
@@ -142,7 +235,7 @@ def format_datetime(dt: Union[datetime, str], format_str: str = "%Y-%m-%d %H:%M"
     """
     if isinstance(dt, str):
         try:
-            dt = datetime.fromisoformat(dt.replace('Z', '+00:00'))
+            dt = _parse_iso_datetime(dt)
         except ValueError:
             return dt
 
@@ -164,26 +257,21 @@ def time_ago(dt: Union[datetime, str]) -> str:
     """
     if isinstance(dt, str):
         try:
-            dt = datetime.fromisoformat(dt.replace('Z', '+00:00'))
+            dt = _parse_iso_datetime(dt)
         except ValueError:
             return dt
 
     if not isinstance(dt, datetime):
         return "Unknown"
 
-    now = datetime.now()
-    diff = now - dt
-
-    if diff.days > 0:
-        return f"{diff.days} day{'s' if diff.days != 1 else ''} ago"
-    elif diff.seconds > 3600:
-        hours = diff.seconds // 3600
-        return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    elif diff.seconds > 60:
-        minutes = diff.seconds // 60
-        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-    else:
-        return "Just now"
+    total = int((datetime.now() - dt).total_seconds())
+
+    for unit_seconds, singular, plural in TIME_AGO_UNITS:
+        if total >= unit_seconds:
+            count = total // unit_seconds
+            return f"{count} {singular if count == 1 else plural} ago"
+
+    return "Just now"
 
 
 def get_next_weekday(weekday: int, hour: int = 9, minute: int = 0) -> datetime:
@@ -199,22 +287,17 @@ def get_next_weekday(weekday: int, hour: int = 9, minute: int = 0) -> datetime:
         Next datetime for specified weekday and time
     """
     now = datetime.now()
-    days_ahead = weekday - now.weekday()
-
-    if days_ahead <= 0:  # Target day has passed this week
-        days_ahead += 7
-
-    next_date = now + timedelta(days=days_ahead)
-    next_date = next_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    target_today = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    days_ahead = (weekday - now.weekday()) % 7
 
     # If it's the same day but time has passed, add a week
-    if next_date <= now:
-        next_date += timedelta(weeks=1)
+    if days_ahead == 0 and target_today <= now:
+        days_ahead = 7
 
-    return next_date
+    return target_today + timedelta(days=days_ahead)
 
 
-def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
+def truncate_text(text: str, max_length: int = 100, suffix: str = DEFAULT_TRUNCATE_SUFFIX) -> str:
     """
     Truncate text to specified length
 
@@ -229,7 +312,12 @@ def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     if not text or len(text) <= max_length:
         return text
 
-    return text[:max_length - len(suffix)] + suffix
+    if suffix is DEFAULT_TRUNCATE_SUFFIX:
+        suffix_len = DEFAULT_TRUNCATE_SUFFIX_LEN
+    else:
+        suffix_len = len(suffix)
+
+    return text[:max_length - suffix_len] + suffix
 
 
 def safe_filename(filename: str) -> str:
@@ -242,13 +330,8 @@ def safe_filename(filename: str) -> str:
     Returns:
         Safe filename
     """
-    # Replace invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-
-    # Replace multiple spaces/underscores with single underscore
-    filename = re.sub(r'[_\s]+', '_', filename)
+    # Replace invalid characters and runs of spaces/underscores with a single underscore
+    filename = UNSAFE_FILENAME_RE.sub('_', filename)
 
     # Remove leading/trailing underscores and dots
     filename = filename.strip('_.')
@@ -256,41 +339,48 @@ def safe_filename(filename: str) -> str:
     return filename
 
 
-def create_error_message(error: Exception, context: str = "") -> str:
+def create_error_message(error: Optional[Exception], context: str = "") -> str:
     """
     Create user-friendly error message
 
     Args:
-        error: Exception object
+        error: Exception object, or None
         context: Additional context about where error occurred
 
     Returns:
         Formatted error message
     """
-    base_message = f"An error occurred"
+    base_message = "An error occurred"
     if context:
         base_message += f" while {context}"
 
+    if error is None:
+        return base_message
+
     error_detail = str(error)
-    if error_detail and error_detail != "":
+    if error_detail:
         base_message += f": {error_detail}"
 
     return base_message
 
 
-def batch_process(items: List, batch_size: int = 10):
+def batch_process(items: Iterable, batch_size: int = 10):
     """
     Generator to process items in batches
 
     Args:
-        items: List of items to process
+        items: Iterable of items to process
         batch_size: Size of each batch
 
     Yields:
-        Batches of items
+        Tuples of up to batch_size items
     """
-    for i in range(0, len(items), batch_size):
-        yield items[i:i + batch_size]
+    iterator = iter(items)
+    while True:
+        batch = tuple(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
 
 
 def show_success_message(message: str, details: Optional[Dict] = None):
@@ -309,17 +399,24 @@ def show_success_message(message: str, details: Optional[Dict] = None):
                 st.write(f"**{key}:** {value}")
 
 
-def show_error_message(message: str, error: Optional[Exception] = None):
+def show_error_message(message: str, error: Optional[Exception] = None, *,
+                       show_details_toggle: bool = False, key: Optional[str] = None):
     """
     Show error message in Streamlit
 
     Args:
         message: Error message
         error: Optional exception object
+        show_details_toggle: Render a checkbox to reveal the exception text
+        key: Widget key for the checkbox, unique within the script run;
+            required when show_details_toggle is True
     """
+    if show_details_toggle and not key:
+        raise ValueError("show_error_message needs a key when show_details_toggle is True")
+
     st.error(f"❌ {message}")
 
-    if error and st.checkbox("Show technical details"):
+    if error and show_details_toggle and st.checkbox("Show technical details", key=key):
         st.code(str(error))
 
 
@@ -334,6 +431,26 @@ def show_info_message(message: str, icon: str = "ℹ️"):
     st.info(f"{icon} {message}")
 
 
+def _format_count(count: int, zero: str, one: str, many: str) -> str:
+    """
+    Format a count using fixed strings for zero and one
+
+    Args:
+        count: Number to format
+        zero: Text returned when count is 0
+        one: Text returned when count is 1
+        many: Noun appended to the formatted count otherwise
+
+    Returns:
+        Formatted string
+    """
+    if count == 0:
+        return zero
+    if count == 1:
+        return one
+    return f"{count:,} {many}"
+
+
 def format_subscriber_count(count: int) -> str:
     """
     Format subscriber count with appropriate pluralization
@@ -344,12 +461,7 @@ def format_subscriber_count(count: int) -> str:
     Returns:
         Formatted string
     """
-    if count == 0:
-        return "No subscribers"
-    elif count == 1:
-        return "1 subscriber"
-    else:
-        return f"{count:,} subscribers"
+    return _format_count(count, "No subscribers", "1 subscriber", "subscribers")
 
 
 def format_article_count(count: int) -> str:
@@ -362,12 +474,7 @@ def format_article_count(count: int) -> str:
     Returns:
         Formatted string
     """
-    if count == 0:
-        return "No articles"
-    elif count == 1:
-        return "1 article"
-    else:
-        return f"{count:,} articles"
+    return _format_count(count, "No articles", "1 article", "articles")
 
 
 def get_weekday_name(weekday: int) -> str:
@@ -380,8 +487,7 @@ def get_weekday_name(weekday: int) -> str:
     Returns:
         Weekday name
     """
-    days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    return days[weekday] if 0 <= weekday <= 6 else 'Unknown'
+    return WEEKDAY_NAMES[weekday] if 0 <= weekday <= 6 else 'Unknown'
 
 
 def create_download_link(data: str, filename: str, mime_type: str = "text/plain") -> str:
@@ -416,39 +522,18 @@ def validate_settings(settings: Dict) -> List[str]:
     """
     errors = []
 
-    # Validate email schedule
-    if 'email_schedule_day' in settings:
-        try:
-            day = int(settings['email_schedule_day'])
-            if not 0 <= day <= 6:
-                errors.append("Email schedule day must be 0-6 (Monday-Sunday)")
-        except ValueError:
-            errors.append("Email schedule day must be a number")
-
-    if 'email_schedule_hour' in settings:
-        try:
-            hour = int(settings['email_schedule_hour'])
-            if not 0 <= hour <= 23:
-                errors.append("Email schedule hour must be 0-23")
-        except ValueError:
-            errors.append("Email schedule hour must be a number")
+    for key, low, high, range_message, number_message in SETTING_RULES:
+        if key not in settings:
+            continue
 
-    if 'email_schedule_minute' in settings:
         try:
-            minute = int(settings['email_schedule_minute'])
-            if not 0 <= minute <= 59:
-                errors.append("Email schedule minute must be 0-59")
-        except ValueError:
-            errors.append("Email schedule minute must be a number")
+            value = int(settings[key])
+        except (ValueError, TypeError):
+            errors.append(number_message)
+            continue
 
-    # Validate retention settings
-    if 'article_retention_days' in settings:
-        try:
-            days = int(settings['article_retention_days'])
-            if days < 1:
-                errors.append("Article retention days must be at least 1")
-        except ValueError:
-            errors.append("Article retention days must be a number")
+        if value < low or (high is not None and value > high):
+            errors.append(range_message)
 
     return errors
 
@@ -456,16 +541,26 @@ def validate_settings(settings: Dict) -> List[str]:
 class ProgressTracker:
     """Simple progress tracker for long-running operations"""
 
+    # Minimum seconds between redraws; each redraw is a round trip to the browser
+    RENDER_INTERVAL = 0.05
+
     def __init__(self, total: int, description: str = "Processing"):
         self.total = total
         self.current = 0
         self.description = description
         self.progress_bar = st.progress(0)
         self.status_text = st.empty()
+        self.last_render = 0.0
 
     def update(self, increment: int = 1, status: str = None):
-        """Update progress"""
+        """Update progress, redrawing at most every RENDER_INTERVAL seconds and always on the last item"""
         self.current += increment
+
+        now = time.monotonic()
+        if now - self.last_render < self.RENDER_INTERVAL and self.current < self.total:
+            return
+        self.last_render = now
+
         progress = min(self.current / self.total, 1.0)
         self.progress_bar.progress(progress)
 
@@ -491,10 +586,14 @@ def export_to_csv(data: List[Dict], filename: str = None) -> str:
     Returns:
         CSV string
     """
-    import pandas as pd
-
     if not data:
         return ""
 
-    df = pd.DataFrame(data)
-    return df.to_csv(index=False)
\ No newline at end of file
+    # Same columns as a DataFrame would build: every key, in first-seen order
+    fieldnames = list(dict.fromkeys(key for row in data for key in row))
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, lineterminator='\n')
+    writer.writeheader()
+    writer.writerows(data)
+    return buffer.getvalue()
\ No newline at end of file